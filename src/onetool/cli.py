@@ -5,10 +5,15 @@ from __future__ import annotations
 import atexit
 import os
 import signal
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def _suppress_shutdown_warnings() -> None:
     """Suppress pymupdf SWIG warnings at exit.
@@ -27,35 +32,55 @@ def _suppress_shutdown_warnings() -> None:
 
 
 atexit.register(_suppress_shutdown_warnings)
-from rich.console import Console
-
 import ot
 from ot._cli import create_cli, version_callback
 from ot.support import get_support_banner, get_version
 
-# Console for CLI output - no auto-highlighting, output to stderr
-console = Console(stderr=True, highlight=False)
-
 app = create_cli(
     "onetool",
     "OneTool MCP server - exposes a single 'run' tool for LLM code generation.",
 )
 
 
+@cache
+def _get_console() -> Console:
+    """Return the console for CLI output - no auto-highlighting, output to stderr.
+
+    Created on first use so --version/--help do not import rich.
+    """
+    from rich.console import Console
+
+    return Console(stderr=True, highlight=False)
+
+
 def _print_startup_banner() -> None:
     """Print startup message to stderr."""
     version = get_version()
-    console.print(f"[bold cyan]OneTool MCP Server[/bold cyan] [dim]v{version}[/dim]")
-    console.print(get_support_banner())
+    # Single print: one markup parse and one write to stderr for both lines
+    _get_console().print(
+        f"[bold cyan]OneTool MCP Server[/bold cyan] [dim]v{version}[/dim]\n"
+        f"{get_support_banner()}"
+    )
+
+
+# Set once handlers are installed so repeated serve entry does not re-register
+_signal_handlers_installed = False
 
 
 def _setup_signal_handlers() -> None:
-    """Set up signal handlers for clean exit."""
+    """Set up signal handlers for clean exit.
+
+    Idempotent: handlers are installed at most once per process.
+    """
+    global _signal_handlers_installed
+    if _signal_handlers_installed:
+        return
+    _signal_handlers_installed = True
 
     def handle_signal(signum: int, _frame: object) -> None:
         """Handle termination signals gracefully."""
         sig_name = signal.Signals(signum).name
-        console.print(f"\nReceived {sig_name}, shutting down...")
+        _get_console().print(f"\nReceived {sig_name}, shutting down...")
         # Use os._exit() for immediate termination - sys.exit() doesn't work
         # well with asyncio event loops and can require multiple Ctrl+C presses
         os._exit(0)
@@ -95,6 +120,7 @@ def init_create() -> None:
     """
     from ot.paths import ensure_global_dir, get_global_dir
 
+    console = _get_console()
     global_dir = get_global_dir()
     if global_dir.exists():
         console.print(f"Global config already exists at {global_dir}/")
@@ -120,6 +146,7 @@ def init_reset() -> None:
         get_template_files,
     )
 
+    console = _get_console()
     global_dir = get_global_dir()
     config_dir = global_dir / CONFIG_SUBDIR
 
@@ -191,6 +218,8 @@ def init_validate() -> None:
     from ot.executor.tool_loader import load_tool_registry
     from ot.paths import CONFIG_SUBDIR, get_global_dir, get_project_dir
 
+    console = _get_console()
+
     # Suppress DEBUG logs from config loader
     logger.remove()
 
@@ -355,15 +384,17 @@ def serve(
         onetool
         onetool --config config/onetool.yaml
     """
+    # Only run if no subcommand was invoked (handles --help automatically).
+    # Subcommands (init ...) manage the global directory themselves, so they
+    # and their --help skip the bootstrap below.
+    if ctx.invoked_subcommand is not None:
+        return
+
     # Bootstrap global config directory on first run
     from ot.paths import ensure_global_dir
 
     ensure_global_dir(quiet=True)
 
-    # Only run if no subcommand was invoked (handles --help automatically)
-    if ctx.invoked_subcommand is not None:
-        return
-
     # Load config if specified
     if config:
         from ot.config.loader import get_config
@@ -5,15 +5,19 @@ Provides common patterns used across onetool and bench CLIs.
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from rich.console import Console
+
+    console: Console
+
 __all__ = ["console", "create_cli", "version_callback"]
 
 
@@ -24,19 +28,38 @@ def _is_debug_tracebacks() -> bool:
     Returns False on any error (fail-safe for broken configs).
     """
     try:
-        import yaml
-
         config_path = Path.home() / ".onetool" / "onetool.yaml"
         if not config_path.exists():
             return False
+
+        # Deferred until the file exists: yaml is a noticeable share of
+        # CLI startup and is otherwise unused before a command runs
+        import yaml
+
         with config_path.open() as f:
             data = yaml.safe_load(f)
         return bool(data.get("debug_tracebacks", False)) if data else False
     except Exception:
         return False
 
-# Shared console instance for consistent output
-console = Console(highlight=False)
+
+@cache
+def _get_console() -> Console:
+    """Return the shared console instance for consistent output.
+
+    Created on first use so that --help and command dispatch do not pay for
+    importing rich.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy access to the shared console (see _get_console)."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def version_callback(name: str, version: str) -> Callable[[bool], None]:
@@ -65,7 +88,7 @@ def version_callback(name: str, version: str) -> Callable[[bool], None]:
 
     def callback(value: bool) -> None:
         if value:
-            console.print(f"{name} version {version}")
+            _get_console().print(f"{name} version {version}")
             raise typer.Exit()
 
     return callback
@@ -48,7 +48,14 @@ if __name__ == "__main__":
     _functions = {
         "{{function}}": {{function}},
     }
-    for line in sys.stdin:
+    # Read raw bytes: requests are single-line JSON and json.loads accepts
+    # bytes, so the text-mode decode layer is skipped
+    stdin = sys.stdin.buffer
+    while line := stdin.readline():
+        # JSON-RPC requests are objects; skip blank lines and other noise
+        # without going through a JSONDecodeError
+        if not line.lstrip().startswith(b"{"):
+            continue
         request = json.loads(line)
         func = _functions.get(request["function"])
         if func is None:
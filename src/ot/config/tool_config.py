@@ -21,12 +21,27 @@ Example usage in a tool file:
 
 from __future__ import annotations
 
+import threading
 from typing import Any, TypeVar, overload
 
 from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+# Raw pack configs resolved against the current config instance.
+# Keyed on the config object itself so a reload (new instance) invalidates it.
+# Thread-safety: Protected by _raw_cache_lock for safe concurrent access.
+_raw_cache: dict[str, dict[str, Any]] = {}
+_raw_cache_owner: object | None = None
+_raw_cache_lock = threading.Lock()
+_MISSING = object()
+
+# Validated config instances keyed by (pack, schema), stored with the raw dict
+# they were built from. A hit requires the same raw dict object, so anything
+# that replaces the raw entry (such as a reload) forces revalidation.
+# Thread-safety: Protected by _raw_cache_lock.
+_typed_cache: dict[tuple[str, type[BaseModel]], tuple[dict[str, Any], BaseModel]] = {}
+
 
 @overload
 def get_tool_config(pack: str, schema: type[T]) -> T: ...
@@ -48,7 +63,9 @@ def get_tool_config(
                 If None, returns raw config dict.
 
     Returns:
-        If schema provided: Instance of schema with config values merged
+        If schema provided: Instance of schema with config values merged. The
+            instance is shared until the configuration changes, so treat it
+            as read-only.
         If no schema: Dict with raw config values (empty dict if not configured)
 
     Example:
@@ -67,23 +84,32 @@ def get_tool_config(
     raw_config = _get_raw_config(pack)
 
     if schema is None:
-        return raw_config
+        # Copy so callers cannot mutate the cached entry
+        return dict(raw_config)
+
+    key = (pack, schema)
+    with _raw_cache_lock:
+        cached = _typed_cache.get(key)
+    if cached is not None and cached[0] is raw_config:
+        return cached[1]  # type: ignore[return-value]
 
     # Validate and return typed config instance
     try:
-        return schema.model_validate(raw_config)
+        typed = schema.model_validate(raw_config)
     except Exception:
         # If validation fails, return defaults from schema
-        return schema()
+        typed = schema()
+
+    with _raw_cache_lock:
+        _typed_cache[key] = (raw_config, typed)
+    return typed
 
 
 def _get_raw_config(pack: str) -> dict[str, Any]:
-    """Get raw config dict for a pack from loaded configuration.
+    """Get raw config dict for a pack, cached per loaded configuration.
 
-    This function handles both typed tools.X fields and extra fields
-    allowed via model_config. It supports:
-    1. Typed tools.X fields (e.g., tools.stats)
-    2. Extra fields for tool packs (e.g., tools.brave)
+    Tools call get_tool_config() on every invocation, so the resolved dict is
+    memoized until get_config() returns a different instance.
 
     Args:
         pack: Pack name (e.g., "brave", "ground")
@@ -91,6 +117,8 @@ def _get_raw_config(pack: str) -> dict[str, Any]:
     Returns:
         Raw config dict for the pack, or empty dict if not configured
     """
+    global _raw_cache_owner
+
     from ot.config.loader import get_config
 
     try:
@@ -99,14 +127,45 @@ def _get_raw_config(pack: str) -> dict[str, Any]:
         # Config not loaded yet - return empty dict
         return {}
 
-    # Get the tools section
-    tools = config.tools
+    with _raw_cache_lock:
+        if config is not _raw_cache_owner:
+            _raw_cache.clear()
+            _typed_cache.clear()
+            _raw_cache_owner = config
+        cached = _raw_cache.get(pack)
+        if cached is not None:
+            return cached
+
+    result = _resolve_raw_config(config.tools, pack)
+
+    with _raw_cache_lock:
+        if config is _raw_cache_owner:
+            _raw_cache[pack] = result
+    return result
+
 
-    # First check for typed attribute (e.g., tools.stats)
-    if hasattr(tools, pack):
-        pack_config = getattr(tools, pack)
-        if hasattr(pack_config, "model_dump"):
-            result: dict[str, Any] = pack_config.model_dump()
+def _resolve_raw_config(tools: Any, pack: str) -> dict[str, Any]:
+    """Resolve the raw config dict for a pack from the tools section.
+
+    This function handles both typed tools.X fields and extra fields
+    allowed via model_config. It supports:
+    1. Typed tools.X fields (e.g., tools.stats)
+    2. Extra fields for tool packs (e.g., tools.brave)
+
+    Args:
+        tools: The ``tools`` section of the loaded configuration
+        pack: Pack name (e.g., "brave", "ground")
+
+    Returns:
+        Raw config dict for the pack, or empty dict if not configured
+    """
+    # First check for typed attribute (e.g., tools.stats) - single fetch
+    # instead of hasattr() followed by getattr()
+    pack_config = getattr(tools, pack, _MISSING)
+    if pack_config is not _MISSING:
+        model_dump = getattr(pack_config, "model_dump", None)
+        if model_dump is not None:
+            result: dict[str, Any] = model_dump()
             return result
         # Handle raw dict from extra fields
         if isinstance(pack_config, dict):
@@ -114,12 +173,10 @@ def _get_raw_config(pack: str) -> dict[str, Any]:
         return {}
 
     # Check model_extra for dynamically allowed fields
-    if hasattr(tools, "model_extra") and tools.model_extra:
-        extra = tools.model_extra
-        if pack in extra:
-            pack_data = extra[pack]
-            if isinstance(pack_data, dict):
-                return pack_data
-            return {}
+    extra = getattr(tools, "model_extra", None)
+    if extra:
+        pack_data = extra.get(pack)
+        if isinstance(pack_data, dict):
+            return pack_data
 
     return {}
@@ -57,6 +57,8 @@ def _create_pack_proxy(pack_name: str, pack_funcs: dict[str, Any]) -> Any:
     class PackProxy:
         """Proxy object that provides dot notation access to pack functions."""
 
+        __slots__ = ("_function_cache",)
+
         def __init__(self) -> None:
             # Cache wrapped functions to avoid recreating on each access
             self._function_cache: dict[str, Callable[..., Any]] = {}
@@ -101,6 +103,8 @@ def _create_mcp_proxy_pack(server_name: str) -> Any:
     class McpProxyPack:
         """Proxy object that routes tool calls to an MCP server."""
 
+        __slots__ = ("_function_cache",)
+
         def __init__(self) -> None:
             # Cache callable proxies to avoid recreating on each access
             self._function_cache: dict[str, Callable[..., str]] = {}
@@ -53,15 +53,20 @@ def get_mcp_tool_param_names(server_name: str, tool_name: str) -> tuple[str, ...
 
     from ot.proxy import get_proxy_manager
 
+    # One list_tools() call fills every tool on the server, so later lookups
+    # for sibling tools are cache hits instead of another list + linear scan
     proxy = get_proxy_manager()
-    tools = proxy.list_tools(server_name)
-    result: tuple[str, ...] = ()
-    for tool in tools:
-        if tool.name == tool_name:
-            result = tuple(get_param_names_from_schema(tool.input_schema))
-            break
-
-    _mcp_param_cache[cache_key] = result
+    for tool in proxy.list_tools(server_name):
+        _mcp_param_cache[(server_name, tool.name)] = tuple(
+            get_param_names_from_schema(tool.input_schema)
+        )
+
+    result = _mcp_param_cache.get(cache_key)
+    if result is None:
+        result = ()
+        _mcp_param_cache[cache_key] = result
+    else:
+        _mcp_param_cache.move_to_end(cache_key)
     while len(_mcp_param_cache) > _MCP_PARAM_CACHE_MAXSIZE:
         _mcp_param_cache.popitem(last=False)
     return result
@@ -16,6 +16,7 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +39,16 @@ def _get_io_executor() -> ThreadPoolExecutor:
     return _io_executor
 
 
+@lru_cache(maxsize=256)
+def _resolve_tool_path(tool_path: Path) -> Path:
+    """Resolve a tool file path to its pool key (cached).
+
+    Every call() resolves the same handful of tool files, so the realpath
+    syscalls are paid once per distinct path.
+    """
+    return tool_path.resolve()
+
+
 @dataclass
 class Worker:
     """A persistent worker subprocess."""
@@ -234,7 +245,7 @@ class WorkerPool:
         Raises:
             RuntimeError: If worker fails or returns an error
         """
-        tool_path = tool_path.resolve()
+        tool_path = _resolve_tool_path(tool_path)
         config = config or {}
         secrets = secrets or {}
 
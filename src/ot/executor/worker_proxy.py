@@ -18,6 +18,8 @@ from ot.stats import timed_tool_call
 class WorkerFunctionProxy:
     """Proxy for a single function that routes calls to a worker."""
 
+    __slots__ = ("config", "function_name", "secrets", "tool_path")
+
     def __init__(
         self,
         tool_path: Path,
@@ -75,6 +77,8 @@ class WorkerPackProxy:
     Provides dot notation access: pack.function(**kwargs)
     """
 
+    __slots__ = ("_function_cache", "config", "functions", "secrets", "tool_path")
+
     def __init__(
         self,
         tool_path: Path,
@@ -34,9 +34,10 @@ from __future__ import annotations
 import atexit
 import contextlib
 import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
 
 # Global shared HTTP client with connection pooling
 _client: httpx.Client | None = None
@@ -49,6 +50,9 @@ def _get_shared_client() -> httpx.Client:
     if _client is None:
         with _client_lock:
             if _client is None:
+                # Deferred so importing this module does not load httpx
+                import httpx
+
                 _client = httpx.Client(
                     timeout=30.0,
                     limits=httpx.Limits(
@@ -61,6 +65,15 @@ def _get_shared_client() -> httpx.Client:
     return _client
 
 
+def warmup() -> None:
+    """Create the shared client ahead of the first request.
+
+    Builds the connection pool and SSL context so the first http_get() call
+    does not pay for them. Safe to call from a background thread.
+    """
+    _get_shared_client()
+
+
 def _shutdown_client() -> None:
     """Close the shared client on exit."""
     global _client
@@ -93,6 +106,8 @@ def http_get(
         Tuple of (success, result). If success, result is parsed JSON dict
         or response text. If failure, result is error message string.
     """
+    import httpx
+
     from ot.logging import LogSpan as LogSpanClass
 
     # Default timeout
@@ -26,6 +26,9 @@ import json
 import time
 from typing import Any
 
+# Shared encoder - avoids building a JSONEncoder per __str__ call
+_encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
 
 class LogEntry:
     """Structured log entry with automatic timing.
@@ -35,13 +38,22 @@ class LogEntry:
     duration.
     """
 
+    __slots__ = (
+        "_error_message",
+        "_error_type",
+        "_fields",
+        "_start_ns",
+        "_status",
+        "_status_code",
+    )
+
     def __init__(self, **initial_fields: Any) -> None:
         """Initialize a log entry with optional initial fields.
 
         Args:
             **initial_fields: Initial fields for the log entry
         """
-        self._start_time = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
         self._fields: dict[str, Any] = dict(initial_fields)
         self._status: str | None = None
         self._status_code: int | None = None
@@ -159,7 +171,7 @@ class LogEntry:
         Returns:
             Duration in seconds (not cached, calculated fresh each call)
         """
-        return round(time.perf_counter() - self._start_time, 3)
+        return round((time.perf_counter_ns() - self._start_ns) / 1e9, 3)
 
     def to_dict(self) -> dict[str, Any]:
         """Return all fields with duration for output.
@@ -191,7 +203,7 @@ class LogEntry:
             JSON string with fields and duration
         """
         output = dict(self._fields)
-        output["duration"] = round(time.perf_counter() - self._start_time, 3)
+        output["duration"] = self.duration
 
         if self._status is not None:
             output["status"] = self._status
@@ -202,7 +214,7 @@ class LogEntry:
         if self._error_message is not None:
             output["errorMessage"] = self._error_message
 
-        return json.dumps(output, separators=(",", ":"), default=str)
+        return _encoder.encode(output)
 
     def __repr__(self) -> str:
         """Return a debug representation.
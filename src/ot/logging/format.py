@@ -21,6 +21,7 @@ Credential sanitisation:
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
@@ -43,8 +44,12 @@ DEFAULT_LIMIT = 120
 URL_WITH_CREDS = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.-]*://)([^:]+):([^@]+)@(.+)$")
 
 
+@lru_cache(maxsize=512)
 def _get_field_limit(field_name: str) -> int:
-    """Get truncation limit for a field based on name patterns.
+    """Get truncation limit for a field based on name patterns (cached).
+
+    Field names repeat across every log entry, so the pattern scan is
+    memoized per name.
 
     Args:
         field_name: Name of the field (case-insensitive matching)
@@ -173,16 +178,27 @@ def format_log_entry(
     Returns:
         New dict with formatted values
     """
-    formatted: dict[str, Any] = {}
+    formatted = dict(entry_dict)
+    format_log_fields(formatted, verbose=verbose)
+    return formatted
+
+
+def format_log_fields(fields: dict[str, Any], verbose: bool = False) -> None:
+    """Format a log entry dict for output in place.
+
+    Same rules as format_log_entry(), for callers that already own a fresh
+    dict (e.g. LogEntry.to_dict()) and do not need a second copy.
 
-    for key, value in entry_dict.items():
+    Args:
+        fields: Log entry dict to update
+        verbose: If True, skip truncation (still sanitizes credentials)
+    """
+    for key, value in fields.items():
         # Always sanitize credentials
         sanitized = sanitize_for_output(value, key)
 
         # Apply truncation unless verbose mode
         if verbose:
-            formatted[key] = sanitized
+            fields[key] = sanitized
         else:
-            formatted[key] = format_value(sanitized, key)
-
-    return formatted
+            fields[key] = format_value(sanitized, key)
@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from ot.logging.entry import LogEntry
-from ot.logging.format import format_log_entry
+from ot.logging.format import format_log_fields
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -34,6 +34,10 @@ if TYPE_CHECKING:
 # FastMCP Context is Any since it's an optional dependency with dynamic methods
 Context = Any  # FastMCP context with log_info, log_error, etc.
 
+# Shared encoder - json.dumps() builds a new JSONEncoder per call when given
+# non-default options, which adds up across every span emitted
+_encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
 
 def _format_for_output(entry: LogEntry) -> str:
     """Format a LogEntry for log output with truncation and sanitisation.
@@ -47,8 +51,10 @@ def _format_for_output(entry: LogEntry) -> str:
     # Import here to avoid circular dependency
     from ot.config import is_log_verbose
 
-    formatted = format_log_entry(entry.to_dict(), verbose=is_log_verbose())
-    return json.dumps(formatted, separators=(",", ":"), default=str)
+    # to_dict() already returns a fresh dict, so format it in place
+    fields = entry.to_dict()
+    format_log_fields(fields, verbose=is_log_verbose())
+    return _encoder.encode(fields)
 
 
 class LogSpan:
@@ -60,6 +66,8 @@ class LogSpan:
     Supports optional FastMCP Context for async logging in MCP tool execution.
     """
 
+    __slots__ = ("_ctx", "_entry", "_level")
+
     def __init__(
         self,
         level: str = "INFO",
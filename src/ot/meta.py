@@ -1074,6 +1074,7 @@ def reload() -> str:
     - Prompts
     - MCP proxy connections
     - Parameter resolution caches
+    - Project .onetool/ directory lookup
 
     Use after modifying config files, adding/removing tools, or
     changing secrets during a session.
@@ -1091,6 +1092,7 @@ def reload() -> str:
         import ot.config.secrets
         import ot.executor.param_resolver
         import ot.executor.tool_loader
+        import ot.paths
         import ot.prompts
         import ot.proxy
         import ot.registry
@@ -1121,6 +1123,9 @@ def reload() -> str:
         ot.executor.param_resolver.get_tool_param_names.cache_clear()
         ot.executor.param_resolver._mcp_param_cache.clear()
 
+        # Clear project .onetool/ existence cache
+        ot.paths._project_dirs.clear()
+
         # Reload config to validate and report stats
         cfg = get_config()
 
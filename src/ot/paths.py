@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -39,6 +40,13 @@ BUNDLED_CONFIG_PACKAGE = "ot.config.defaults"
 # Package containing global templates (copied to ~/.onetool/ on first run)
 GLOBAL_TEMPLATES_PACKAGE = "ot.config.global_templates"
 
+# Project .onetool/ directories found by get_project_dir(). Only hits are
+# cached, so a directory created later - by ensure_project_dir() or anything
+# else - is picked up on the next call. Hits are not re-checked: a .onetool/
+# deleted while the server runs is still returned until ot.reload() clears
+# this set. That keeps the lookup stat-free on the hot path.
+_project_dirs: set[Path] = set()
+
 
 def _resolve_package_dir(package_name: str, description: str) -> Path:
     """Resolve a package to a filesystem directory path.
@@ -149,10 +157,21 @@ def get_effective_cwd() -> Path:
     """
     env_cwd = os.getenv("OT_CWD")
     if env_cwd:
-        return Path(env_cwd).resolve()
+        return _resolve_env_cwd(env_cwd)
     return Path.cwd()
 
 
+@lru_cache(maxsize=8)
+def _resolve_env_cwd(env_cwd: str) -> Path:
+    """Resolve an OT_CWD value (cached).
+
+    get_effective_cwd() runs on every relative path resolution, while
+    OT_CWD is set once per process, so the resolve() syscalls are paid once
+    per distinct value.
+    """
+    return Path(env_cwd).resolve()
+
+
 def get_global_dir() -> Path:
     """Get the global OneTool directory path.
 
@@ -176,7 +195,10 @@ def get_project_dir(start: Path | None = None) -> Path | None:
     """
     cwd = start or get_effective_cwd()
     candidate = cwd / PROJECT_DIR_NAME
+    if candidate in _project_dirs:
+        return candidate
     if candidate.is_dir():
+        _project_dirs.add(candidate)
         return candidate
     return None
 
@@ -367,6 +389,8 @@ def expand_path(path: str) -> Path:
     Returns:
         Expanded absolute Path
     """
+    if not path.startswith("~"):
+        return Path(path).resolve()
     return Path(path).expanduser().resolve()
 
 
@@ -447,7 +471,8 @@ def resolve_cwd_path(path: str) -> Path:
         >>> resolve_cwd_path("~/output.txt")
         PosixPath('/home/user/output.txt')
     """
-    p = Path(path).expanduser()
+    # Only ~ paths need expanduser(); skip its re-parse for everything else
+    p = Path(path).expanduser() if path.startswith("~") else Path(path)
     if p.is_absolute():
         return p.resolve()
     return (get_effective_cwd() / p).resolve()
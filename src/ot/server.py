@@ -24,6 +24,7 @@ Note: mcp__ot__run is NOT valid.
 
 from __future__ import annotations
 
+import threading
 import time
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
@@ -37,6 +38,7 @@ from loguru import logger
 from ot.config.loader import get_config
 from ot.executor import SimpleExecutor, execute_command
 from ot.executor.runner import prepare_command
+from ot.http_client import warmup as warmup_http_client
 
 # Import logging first to remove Loguru's default console handler
 from ot.logging import LogSpan, configure_logging
@@ -85,6 +87,12 @@ async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
                 await proxy.connect(_config.servers)
             start_span.add("proxyCount", len(_config.servers))
 
+        # Build the shared HTTP client off the event loop so the first
+        # request does not pay for pool and SSL context setup
+        threading.Thread(
+            target=warmup_http_client, name="http-warmup", daemon=True
+        ).start()
+
         # Log tool count from registry
         registry = get_registry()
         start_span.add("toolCount", len(registry.tools))
@@ -12,33 +12,73 @@ Extension tools (user-created in .onetool/tools/) can import directly from
 ot.* modules for logging, config, and inter-tool calling.
 """
 
-from ot.utils.batch import batch_execute, format_batch_results, normalize_items
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Imported eagerly: ``cache`` and ``truncate`` share names with their
+# submodules, and importing a submodule binds the package attribute to the
+# module, which would shadow the lazy lookup below. Both are stdlib-only.
 from ot.utils.cache import CacheNamespace, cache
-from ot.utils.deps import (
-    Dependency,
-    DepsCheckResult,
-    check_cli,
-    check_deps,
-    check_lib,
-    check_secret,
-    ensure_cli,
-    ensure_lib,
-    requires_cli,
-    requires_lib,
-)
-from ot.utils.exceptions import flatten_exception_group
-from ot.utils.factory import LazyClient, lazy_client
-from ot.utils.format import serialize_result
-from ot.utils.http import api_headers, check_api_key, safe_request
-from ot.utils.platform import get_install_hint
-from ot.utils.sanitize import (
-    sanitize_output,
-    sanitize_tag_closes,
-    sanitize_triggers,
-    wrap_external_content,
-)
 from ot.utils.truncate import format_error, run_command, truncate
 
+if TYPE_CHECKING:
+    from ot.utils.batch import batch_execute, format_batch_results, normalize_items
+    from ot.utils.deps import (
+        Dependency,
+        DepsCheckResult,
+        check_cli,
+        check_deps,
+        check_lib,
+        check_secret,
+        ensure_cli,
+        ensure_lib,
+        requires_cli,
+        requires_lib,
+    )
+    from ot.utils.exceptions import flatten_exception_group
+    from ot.utils.factory import LazyClient, lazy_client
+    from ot.utils.format import serialize_result
+    from ot.utils.http import api_headers, check_api_key, safe_request
+    from ot.utils.platform import get_install_hint
+    from ot.utils.sanitize import (
+        sanitize_output,
+        sanitize_tag_closes,
+        sanitize_triggers,
+        wrap_external_content,
+    )
+
+# Name -> defining submodule. Resolved on first attribute access (PEP 562) so
+# that ``import ot.utils`` does not pull in ot.config via ot.utils.http.
+_LAZY_IMPORTS: dict[str, str] = {
+    "batch_execute": "ot.utils.batch",
+    "format_batch_results": "ot.utils.batch",
+    "normalize_items": "ot.utils.batch",
+    "Dependency": "ot.utils.deps",
+    "DepsCheckResult": "ot.utils.deps",
+    "check_cli": "ot.utils.deps",
+    "check_deps": "ot.utils.deps",
+    "check_lib": "ot.utils.deps",
+    "check_secret": "ot.utils.deps",
+    "ensure_cli": "ot.utils.deps",
+    "ensure_lib": "ot.utils.deps",
+    "requires_cli": "ot.utils.deps",
+    "requires_lib": "ot.utils.deps",
+    "flatten_exception_group": "ot.utils.exceptions",
+    "LazyClient": "ot.utils.factory",
+    "lazy_client": "ot.utils.factory",
+    "serialize_result": "ot.utils.format",
+    "api_headers": "ot.utils.http",
+    "check_api_key": "ot.utils.http",
+    "safe_request": "ot.utils.http",
+    "get_install_hint": "ot.utils.platform",
+    "sanitize_output": "ot.utils.sanitize",
+    "sanitize_tag_closes": "ot.utils.sanitize",
+    "sanitize_triggers": "ot.utils.sanitize",
+    "wrap_external_content": "ot.utils.sanitize",
+}
+
 __all__ = [
     # Cache
     "CacheNamespace",
@@ -79,3 +119,18 @@ __all__ = [
     "truncate",
     "wrap_external_content",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for utilities to keep package import cheap."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
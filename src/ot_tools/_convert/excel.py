@@ -9,17 +9,21 @@ Converts XLSX spreadsheets to Markdown with:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path  # noqa: TC003 (used at runtime)
 from typing import Any
 
 from ot_tools._convert.utils import (
     IncrementalWriter,
+    WhitespaceNormaliser,
     compute_file_checksum,
     get_mtime_iso,
-    normalise_whitespace,
     write_toc_file,
 )
 
+# Escapes pipes and flattens newlines in Markdown table cells (single pass)
+_PIPE_TABLE = str.maketrans({"|": "\\|", "\n": " "})
+
 
 def convert_excel(
     input_path: Path,
@@ -75,25 +79,34 @@ def convert_excel(
     wb = load_workbook(input_path, read_only=read_only, data_only=not include_formulas)
 
     # Get metadata for frontmatter
-    checksum = compute_file_checksum(input_path)
-    mtime = get_mtime_iso(input_path)
+    stat = input_path.stat()
+    checksum = compute_file_checksum(input_path, stat)
+    mtime = get_mtime_iso(input_path, stat)
     total_sheets = len(wb.sheetnames)
 
     writer = IncrementalWriter()
     total_rows = 0
 
-    # Process each sheet (single workbook - no double loading)
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        rows = _process_sheet(writer, sheet_name, ws, include_formulas, formula_model)
-        total_rows += rows
-
-    wb.close()
-
-    # Write main output (pure content, no frontmatter - line numbers start at 1)
-    content = normalise_whitespace(writer.get_content())
+    # Write main output (pure content, no frontmatter - line numbers start at 1).
+    # Each sheet is normalised and streamed to the file as soon as it is
+    # processed, so memory is bounded by the largest sheet, not the workbook.
     output_path = output_dir / f"{input_path.stem}.md"
-    output_path.write_text(content, encoding="utf-8")
+    try:
+        with output_path.open("w", encoding="utf-8") as f:
+            out = WhitespaceNormaliser(f)
+            # Process each sheet (single workbook - no double loading)
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+                rows = _process_sheet(writer, sheet_name, ws, include_formulas, formula_model)
+                total_rows += rows
+                out.write(writer.drain())
+            out.close()
+    except BaseException:
+        # Don't leave a truncated document behind
+        output_path.unlink(missing_ok=True)
+        raise
+    finally:
+        wb.close()
 
     # Write separate TOC file (includes frontmatter)
     headings = writer.get_headings()
@@ -122,7 +135,9 @@ def _process_sheet(
     include_formulas: bool,
     formula_model: Any = None,
 ) -> int:
-    """Process a single worksheet with streaming (O(1) memory for row data).
+    """Process a single worksheet, streaming rows from the workbook.
+
+    The sheet's Markdown is joined and written to the writer in one call.
 
     When include_formulas=True, the workbook was loaded with data_only=False,
     so formula cells contain the formula string as their value.
@@ -139,33 +154,36 @@ def _process_sheet(
     """
     writer.write_heading(2, f"Sheet: {sheet_name}")
 
-    # First pass: count max columns (streaming, no data storage)
-    max_cols = 0
-    row_count = 0
-    for row in ws.iter_rows():
-        max_cols = max(max_cols, len(row))
-        row_count += 1
-
-    if row_count == 0:
-        writer.write("(empty sheet)\n\n")
-        return 0
+    # Column count from the sheet dimensions, so rows are streamed once.
+    # Read-only sheets without a <dimension> record report None; only then
+    # fall back to a counting pass.
+    max_cols = ws.max_column
+    if max_cols is None:
+        max_cols = max((len(row) for row in ws.iter_rows(values_only=True)), default=0)
 
-    # Second pass: stream rows directly to writer
-    rows_iter = iter(ws.iter_rows())
+    # Stream rows directly to writer. values_only yields plain value tuples,
+    # so no cell object is built per cell.
+    rows_iter = iter(ws.iter_rows(values_only=True))
 
     # Get header (first row)
-    first_row = next(rows_iter)
+    first_row = next(rows_iter, None)
+    if first_row is None:
+        writer.write("(empty sheet)\n\n")
+        return 0
+    row_count = 1
     header = [
-        _get_cell_value(cell, sheet_name, 1, j + 1, formula_model)
-        for j, cell in enumerate(first_row)
+        _get_cell_value(value, sheet_name, 1, j + 1, formula_model)
+        for j, value in enumerate(first_row)
     ]
     # Pad header to max_cols
     while len(header) < max_cols:
         header.append("")
 
-    # Write header
-    writer.write("| " + " | ".join(_escape_pipe(c) for c in header) + " |\n")
-    writer.write("| " + " | ".join("---" for _ in header) + " |\n")
+    # Table lines are collected and handed to the writer in one call per sheet
+    lines = [
+        "| " + " | ".join(c.translate(_PIPE_TABLE) for c in header) + " |\n",
+        _separator_line(len(header)),
+    ]
 
     # Collect formulas as we go (just formula tuples, not full row data)
     # Format: (col_letter, row_num, formula_string)
@@ -173,54 +191,47 @@ def _process_sheet(
 
     # Check first row for formulas (cell values are formulas when include_formulas=True)
     if include_formulas:
-        for j, cell in enumerate(first_row):
-            try:
-                value = cell.value
-                if isinstance(value, str) and value.startswith("="):
-                    formulas.append((_col_letter(j + 1), 1, value))
-            except Exception:
-                pass
+        for j, value in enumerate(first_row):
+            if isinstance(value, str) and value.startswith("="):
+                formulas.append((_col_letter(j + 1), 1, value))
 
-    # Stream remaining rows directly to writer
+    # Stream remaining rows
     current_row = 2  # 1-indexed, header was row 1
     for row in rows_iter:
         row_values = [
-            _get_cell_value(cell, sheet_name, current_row, j + 1, formula_model)
-            for j, cell in enumerate(row)
+            _get_cell_value(value, sheet_name, current_row, j + 1, formula_model)
+            for j, value in enumerate(row)
         ]
         # Pad row to max_cols
         while len(row_values) < max_cols:
             row_values.append("")
 
-        writer.write("| " + " | ".join(_escape_pipe(c) for c in row_values[:len(header)]) + " |\n")
+        lines.append("| " + " | ".join(c.translate(_PIPE_TABLE) for c in row_values[:len(header)]) + " |\n")
 
         # Track formulas for this row (cell values are formulas when include_formulas=True)
         if include_formulas:
-            for j, cell in enumerate(row):
-                try:
-                    value = cell.value
-                    if isinstance(value, str) and value.startswith("="):
-                        formulas.append((_col_letter(j + 1), current_row, value))
-                except Exception:
-                    pass
+            for j, value in enumerate(row):
+                if isinstance(value, str) and value.startswith("="):
+                    formulas.append((_col_letter(j + 1), current_row, value))
 
         current_row += 1
+        row_count += 1
 
-    writer.write("\n")
+    lines.append("\n")
 
     # Add formulas section if any formulas found
     if formulas:
-        writer.write("**Formulas:**\n\n")
-        writer.write("```\n")
-        for col_letter, row_num, formula in formulas:
-            writer.write(f"{col_letter}{row_num}: {formula}\n")
-        writer.write("```\n\n")
+        lines.append("**Formulas:**\n\n```\n")
+        lines.extend(f"{col_letter}{row_num}: {formula}\n" for col_letter, row_num, formula in formulas)
+        lines.append("```\n\n")
+
+    writer.write("".join(lines))
 
     return row_count
 
 
 def _get_cell_value(
-    cell: Any,
+    value: Any,
     sheet_name: str,
     row_num: int,
     col_num: int,
@@ -229,7 +240,7 @@ def _get_cell_value(
     """Get cell value, optionally computing from formula model.
 
     Args:
-        cell: openpyxl cell object
+        value: Raw cell value (from iter_rows(values_only=True))
         sheet_name: Name of the worksheet (for formula lookup)
         row_num: 1-indexed row number
         col_num: 1-indexed column number
@@ -238,8 +249,6 @@ def _get_cell_value(
     Returns:
         String representation of cell value
     """
-    value = cell.value
-
     # If we have a value, use it
     if value is not None:
         return str(value)
@@ -265,13 +274,15 @@ def _get_cell_value(
     return ""
 
 
-def _escape_pipe(text: str) -> str:
-    """Escape pipe characters for Markdown tables."""
-    return text.replace("|", "\\|").replace("\n", " ")
+@lru_cache(maxsize=64)
+def _separator_line(ncols: int) -> str:
+    """Markdown table header separator for ncols columns (cached by width)."""
+    return "| " + " | ".join(["---"] * ncols) + " |\n"
 
 
+@lru_cache(maxsize=16384)  # Excel's column limit (XFD)
 def _col_letter(n: int) -> str:
-    """Convert column number to letter (1=A, 2=B, ..., 27=AA)."""
+    """Convert column number to letter (1=A, 2=B, ..., 27=AA) (cached)."""
     result = ""
     while n > 0:
         n, remainder = divmod(n - 1, 26)
@@ -27,10 +27,10 @@ if TYPE_CHECKING:
 
 from ot_tools._convert.utils import (
     IncrementalWriter,
+    WhitespaceNormaliser,
     compute_file_checksum,
     compute_image_hash,
     get_mtime_iso,
-    normalise_whitespace,
     write_toc_file,
 )
 
@@ -179,8 +179,9 @@ def convert_pdf(
         total_pages = len(doc)
 
         # Get metadata for frontmatter
-        checksum = compute_file_checksum(input_path)
-        mtime = get_mtime_iso(input_path)
+        stat = input_path.stat()
+        checksum = compute_file_checksum(input_path, stat)
+        mtime = get_mtime_iso(input_path, stat)
 
         # Get outline for heading insertion
         outline = _get_outline_headings(doc)
@@ -195,45 +196,53 @@ def convert_pdf(
         writer = IncrementalWriter()
         images_extracted = 0
 
-        # Process pages with lazy loading
-        for pageno in range(total_pages):
-            page = doc[pageno]
-            page_num = pageno + 1
-
-            # Insert outline headings for this page
-            if page_num in outline_by_page:
-                for level, title in outline_by_page[page_num]:
-                    writer.write_heading(min(level, 6), title)
-            elif not outline:
-                # No outline - use page numbers as structure
-                writer.write_heading(1, f"Page {page_num}")
-
-            # Extract text
-            text = page.get_text("text")
-            if text.strip():
-                writer.write(text.rstrip() + "\n\n")
-
-            # Extract images - process one at a time to minimize memory
-            image_list = page.get_images(full=True)
-            for img in image_list:
-                xref = img[0]
-                try:
-                    result = _extract_and_save_image(
-                        doc, xref, images_dir, writer
-                    )
-                    if result:
-                        images_extracted += 1
-                except Exception:
-                    # Skip failed image extraction
-                    continue
+        # Write main output (pure content, no frontmatter - line numbers start at 1).
+        # Each page is normalised and streamed to the file as soon as it is
+        # processed, so memory is bounded by the largest page, not the document.
+        output_path = output_dir / f"{input_path.stem}.md"
+        try:
+            with output_path.open("w", encoding="utf-8") as f:
+                out = WhitespaceNormaliser(f)
+                # Process pages with lazy loading
+                for pageno in range(total_pages):
+                    page = doc[pageno]
+                    page_num = pageno + 1
+
+                    # Insert outline headings for this page
+                    if page_num in outline_by_page:
+                        for level, title in outline_by_page[page_num]:
+                            writer.write_heading(min(level, 6), title)
+                    elif not outline:
+                        # No outline - use page numbers as structure
+                        writer.write_heading(1, f"Page {page_num}")
+
+                    # Extract text
+                    text = page.get_text("text")
+                    if text.strip():
+                        writer.write(text.rstrip() + "\n\n")
+
+                    # Extract images - process one at a time to minimize memory
+                    image_list = page.get_images(full=True)
+                    for img in image_list:
+                        xref = img[0]
+                        try:
+                            result = _extract_and_save_image(
+                                doc, xref, images_dir, writer
+                            )
+                            if result:
+                                images_extracted += 1
+                        except Exception:
+                            # Skip failed image extraction
+                            continue
+                    out.write(writer.drain())
+                out.close()
+        except BaseException:
+            # Don't leave a truncated document behind
+            output_path.unlink(missing_ok=True)
+            raise
     finally:
         doc.close()
 
-    # Write main output (pure content, no frontmatter - line numbers start at 1)
-    content = normalise_whitespace(writer.get_content())
-    output_path = output_dir / f"{input_path.stem}.md"
-    output_path.write_text(content, encoding="utf-8")
-
     # Write separate TOC file (includes frontmatter)
     headings = writer.get_headings()
     toc_path = write_toc_file(
@@ -24,9 +24,9 @@ except ImportError as e:
 
 from ot_tools._convert.utils import (
     IncrementalWriter,
+    WhitespaceNormaliser,
     compute_file_checksum,
     get_mtime_iso,
-    normalise_whitespace,
     save_image,
     write_toc_file,
 )
@@ -60,8 +60,9 @@ def convert_powerpoint(
     prs: PresentationType = Presentation(str(input_path))
     try:
         # Get metadata for frontmatter
-        checksum = compute_file_checksum(input_path)
-        mtime = get_mtime_iso(input_path)
+        stat = input_path.stat()
+        checksum = compute_file_checksum(input_path, stat)
+        mtime = get_mtime_iso(input_path, stat)
         total_slides = len(prs.slides)
 
         # Set up images directory
@@ -69,23 +70,31 @@ def convert_powerpoint(
         writer = IncrementalWriter()
         images_extracted = 0
 
-        # Process slides
-        for slide_idx, slide in enumerate(prs.slides, 1):
-            imgs = _process_slide(
-                slide, slide_idx, writer, images_dir, include_notes
-            )
-            images_extracted += imgs
+        # Write main output (pure content, no frontmatter - line numbers start at 1).
+        # Each slide is normalised and streamed to the file as soon as it is
+        # processed, so memory is bounded by the largest slide, not the deck.
+        output_path = output_dir / f"{input_path.stem}.md"
+        try:
+            with output_path.open("w", encoding="utf-8") as f:
+                out = WhitespaceNormaliser(f)
+                # Process slides
+                for slide_idx, slide in enumerate(prs.slides, 1):
+                    imgs = _process_slide(
+                        slide, slide_idx, writer, images_dir, include_notes
+                    )
+                    images_extracted += imgs
+                    out.write(writer.drain())
+                out.close()
+        except BaseException:
+            # Don't leave a truncated document behind
+            output_path.unlink(missing_ok=True)
+            raise
     finally:
         # Ensure presentation resources are released
         # python-pptx Presentation doesn't have explicit close, but we can
         # help garbage collection by clearing references
         del prs
 
-    # Write main output (pure content, no frontmatter - line numbers start at 1)
-    content = normalise_whitespace(writer.get_content())
-    output_path = output_dir / f"{input_path.stem}.md"
-    output_path.write_text(content, encoding="utf-8")
-
     # Write separate TOC file (includes frontmatter)
     headings = writer.get_headings()
     toc_path = write_toc_file(
@@ -17,7 +17,9 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import os
     from collections.abc import Sequence
+    from typing import TextIO
 
 from functools import lru_cache
 
@@ -27,14 +29,14 @@ _CHECKSUM_CACHE_MAX_SIZE = 100
 @lru_cache(maxsize=_CHECKSUM_CACHE_MAX_SIZE)
 def _compute_checksum_cached(
     path_str: str,
-    mtime: float,  # noqa: ARG001 - used as cache key
+    mtime_ns: int,  # noqa: ARG001 - used as cache key
     size: int,  # noqa: ARG001 - used as cache key
 ) -> str:
     """Cached checksum computation (thread-safe via lru_cache).
 
     Args:
         path_str: Resolved path string
-        mtime: File modification time (for cache invalidation)
+        mtime_ns: File modification time in ns (for cache invalidation)
         size: File size in bytes (for cache invalidation)
 
     Returns:
@@ -48,7 +50,7 @@ def _compute_checksum_cached(
     return f"sha256:{sha256.hexdigest()}"
 
 
-def compute_file_checksum(path: Path) -> str:
+def compute_file_checksum(path: Path, stat: os.stat_result | None = None) -> str:
     """Compute SHA256 checksum of a file (with thread-safe caching).
 
     Results are cached based on path+mtime+size to avoid redundant reads
@@ -56,12 +58,14 @@ def compute_file_checksum(path: Path) -> str:
 
     Args:
         path: Path to file
+        stat: Precomputed path.stat() result, to share one stat call
 
     Returns:
         Checksum in format 'sha256:abc123...'
     """
-    stat = path.stat()
-    return _compute_checksum_cached(str(path.resolve()), stat.st_mtime, stat.st_size)
+    if stat is None:
+        stat = path.stat()
+    return _compute_checksum_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
 
 def compute_image_hash(data: bytes) -> str:
@@ -110,16 +114,17 @@ def save_image(data: bytes, images_dir: Path, content_type: str) -> Path:
     return img_path
 
 
-def get_mtime_iso(path: Path) -> str:
+def get_mtime_iso(path: Path, stat: os.stat_result | None = None) -> str:
     """Get file modification time as ISO 8601 string.
 
     Args:
         path: Path to file
+        stat: Precomputed path.stat() result, to share one stat call
 
     Returns:
         ISO 8601 timestamp with Z suffix
     """
-    mtime = path.stat().st_mtime
+    mtime = (stat or path.stat()).st_mtime
     return datetime.fromtimestamp(mtime, tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
@@ -298,6 +303,57 @@ def normalise_whitespace(content: str) -> str:
     return result
 
 
+class WhitespaceNormaliser:
+    """Streaming form of normalise_whitespace() for file output.
+
+    Text is fed in chunks. The completed lines of each chunk are normalised
+    and written with a single write call, so memory use is bounded by the
+    chunk size rather than the whole document. The bytes written equal
+    normalise_whitespace() of the concatenated input.
+    """
+
+    def __init__(self, out: TextIO) -> None:
+        self._out = out
+        self._partial = ""
+        self._blank_count = 0
+        self._written = False
+
+    def write(self, text: str) -> None:
+        """Normalise text and write all completed lines."""
+        data = (self._partial + text).replace("\r\n", "\n")
+        # A trailing CR may be the first half of a CRLF split across chunks
+        hold = ""
+        if data.endswith("\r"):
+            data, hold = data[:-1], "\r"
+        lines = data.replace("\r", "\n").split("\n")
+        self._partial = lines.pop() + hold
+
+        # Blank lines are held back until a non-blank line follows, so
+        # trailing blanks can be dropped on close()
+        result_lines: list[str] = []
+        blank_count = self._blank_count
+        for line in map(str.rstrip, lines):
+            if not line:
+                blank_count += 1
+                continue
+            if blank_count:
+                # Collapse blank runs to max 2 consecutive
+                result_lines.extend([""] * min(blank_count, 2))
+                blank_count = 0
+            result_lines.append(line)
+        self._blank_count = blank_count
+        if result_lines:
+            result_lines.append("")
+            self._out.write("\n".join(result_lines))
+            self._written = True
+
+    def close(self) -> None:
+        """Flush the last line; trailing blank lines are dropped."""
+        self.write("\n")
+        if not self._written:
+            self._out.write("\n")
+
+
 class IncrementalWriter:
     """Write content incrementally to track line numbers.
 
@@ -346,6 +402,16 @@ class IncrementalWriter:
         """Get buffered content."""
         return self._buffer.getvalue()
 
+    def drain(self) -> str:
+        """Get buffered content and clear the buffer.
+
+        Line and heading tracking continue across drains, so content can be
+        written out piecewise (e.g. per sheet) while the TOC stays correct.
+        """
+        content = self._buffer.getvalue()
+        self._buffer = io.StringIO()
+        return content
+
     def get_headings(self) -> list[tuple[int, str, int, int]]:
         """Get collected headings for TOC generation."""
         # Close any open heading
@@ -25,9 +25,9 @@ except ImportError as e:
 
 from ot_tools._convert.utils import (
     IncrementalWriter,
+    WhitespaceNormaliser,
     compute_file_checksum,
     get_mtime_iso,
-    normalise_whitespace,
     save_image,
     write_toc_file,
 )
@@ -56,8 +56,9 @@ def convert_word(
     doc: DocumentType = Document(str(input_path))
     try:
         # Get metadata for frontmatter
-        checksum = compute_file_checksum(input_path)
-        mtime = get_mtime_iso(input_path)
+        stat = input_path.stat()
+        checksum = compute_file_checksum(input_path, stat)
+        mtime = get_mtime_iso(input_path, stat)
 
         # Count pages (approximate - Word doesn't store exact page count)
         # Use paragraph count / 40 as rough estimate
@@ -72,22 +73,35 @@ def convert_word(
         tables_processed = 0
         processed_image_rels: set[str] = set()
 
-        # Process document elements in order
-        for element in doc.element.body:
-            if isinstance(element, CT_P):
-                paragraph = Paragraph(element, doc)
-                _process_paragraph(
-                    paragraph, writer, doc, images_dir, processed_image_rels
-                )
-                if paragraph.text.strip():
-                    paragraphs_processed += 1
-                    # Count images extracted during paragraph processing
-                    images_extracted = len(processed_image_rels)
-
-            elif isinstance(element, CT_Tbl):
-                table = Table(element, doc)
-                _process_table(table, writer)
-                tables_processed += 1
+        # Write main output (pure content, no frontmatter - line numbers start at 1).
+        # Each body element is normalised and streamed to the file as soon as
+        # it is processed, so the whole document is never held as text.
+        output_path = output_dir / f"{input_path.stem}.md"
+        try:
+            with output_path.open("w", encoding="utf-8") as f:
+                out = WhitespaceNormaliser(f)
+                # Process document elements in order
+                for element in doc.element.body:
+                    if isinstance(element, CT_P):
+                        paragraph = Paragraph(element, doc)
+                        _process_paragraph(
+                            paragraph, writer, doc, images_dir, processed_image_rels
+                        )
+                        if paragraph.text.strip():
+                            paragraphs_processed += 1
+                            # Count images extracted during paragraph processing
+                            images_extracted = len(processed_image_rels)
+
+                    elif isinstance(element, CT_Tbl):
+                        table = Table(element, doc)
+                        _process_table(table, writer)
+                        tables_processed += 1
+                    out.write(writer.drain())
+                out.close()
+        except BaseException:
+            # Don't leave a truncated document behind
+            output_path.unlink(missing_ok=True)
+            raise
 
         # Extract remaining images not caught inline
         for rel_id, rel in doc.part.rels.items():
@@ -105,11 +119,6 @@ def convert_word(
         # help garbage collection by clearing references
         del doc
 
-    # Write main output (pure content, no frontmatter - line numbers start at 1)
-    content = normalise_whitespace(writer.get_content())
-    output_path = output_dir / f"{input_path.stem}.md"
-    output_path.write_text(content, encoding="utf-8")
-
     # Write separate TOC file (includes frontmatter)
     headings = writer.get_headings()
     toc_path = write_toc_file(
@@ -9,9 +9,12 @@ Reference: https://github.com/chunkhound/chunkhound
 
 from __future__ import annotations
 
+import atexit
 import logging
 import threading
-from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 # Pack for dot notation: code.search(), code.status()
@@ -43,8 +46,55 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Thread lock for connection cache operations
+# Open connections keyed by database path: (mtime_ns, connection, table names).
+# One entry per path - a rebuilt database (new mtime) closes the old connection
+# so DuckDB drops its cached instance and the reconnect sees the new file.
+# _connection_users counts callers still using each path's connection, so the
+# old connection is only closed once they have released it.
+# Thread-safety: Protected by _connection_lock.
+_connections: dict[str, tuple[int, Any, tuple[str, ...]]] = {}
+_connection_users: dict[str, int] = {}
 _connection_lock = threading.Lock()
+_connection_released = threading.Condition(_connection_lock)
+
+# Query embeddings keyed by (base_url, model, query) - persists across calls
+# in process so repeated queries skip the embeddings API round trip.
+# Uses OrderedDict for LRU eviction with bounded size
+_EMBEDDING_CACHE_MAXSIZE = 256
+
+# Maximum inputs per embeddings API request (OpenAI limit)
+_EMBEDDING_BATCH_SIZE = 2048
+
+# Files larger than this are read only up to the last expanded line needed
+_PARTIAL_READ_MIN_BYTES = 256 * 1024
+_embedding_cache_lock = threading.Lock()
+_embedding_cache: OrderedDict[tuple[str, str, str], list[float]] = OrderedDict()
+
+# Shared thread pool for embedding requests (created lazily), so the API
+# round trip overlaps with opening and validating the database
+_embedding_executor: ThreadPoolExecutor | None = None
+
+
+def _get_embedding_executor() -> ThreadPoolExecutor:
+    """Get or create the shared embedding thread pool."""
+    global _embedding_executor
+    if _embedding_executor is None:
+        _embedding_executor = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="code-embed",
+        )
+    return _embedding_executor
+
+
+def _shutdown_executor() -> None:
+    """Shutdown the embedding thread pool on exit."""
+    global _embedding_executor
+    if _embedding_executor is not None:
+        _embedding_executor.shutdown(wait=False)
+        _embedding_executor = None
+
+
+atexit.register(_shutdown_executor)
 
 
 class Config(BaseModel):
@@ -149,12 +199,8 @@ def _import_duckdb() -> ModuleType:
     return duckdb
 
 
-@lru_cache(maxsize=4)
-def _get_cached_connection(db_path: str) -> Any:
-    """Get cached read-only connection to ChunkHound database.
-
-    Connections are cached by path and reused. Call _clear_connection_cache()
-    if database is rebuilt.
+def _open_connection(db_path: str) -> Any:
+    """Open a read-only connection to a ChunkHound database.
 
     Args:
         db_path: Path to the DuckDB database file.
@@ -180,10 +226,69 @@ def _get_cached_connection(db_path: str) -> Any:
     return conn
 
 
+def _get_connection(db_path: Path) -> tuple[Any, tuple[str, ...]]:
+    """Get the cached connection and table names for a ChunkHound database.
+
+    The entry is reused while the database file's mtime is unchanged. When
+    the index is rebuilt, the old connection is closed before reconnecting;
+    otherwise DuckDB would hand back its still-open instance of the old file.
+    Callers still using the old connection finish first: the reconnect waits
+    until they have all called _release_connection.
+
+    Every successful call must be paired with _release_connection(db_path).
+
+    Args:
+        db_path: Path to the DuckDB database file.
+
+    Returns:
+        Tuple of (connection, table names in SHOW TABLES order).
+    """
+    key = str(db_path)
+    mtime_ns = db_path.stat().st_mtime_ns
+    with _connection_lock:
+        entry = _connections.get(key)
+        while entry is not None and entry[0] != mtime_ns and _connection_users.get(key):
+            # Let callers still using the old index finish before closing it
+            _connection_released.wait()
+            entry = _connections.get(key)
+        if entry is not None:
+            if entry[0] == mtime_ns:
+                _connection_users[key] = _connection_users.get(key, 0) + 1
+                return entry[1], entry[2]
+            del _connections[key]
+            entry[1].close()
+
+        conn = _open_connection(key)
+        try:
+            tables = tuple(row[0] for row in conn.execute("SHOW TABLES").fetchall())
+        except Exception:
+            conn.close()
+            raise
+        _connections[key] = (mtime_ns, conn, tables)
+        _connection_users[key] = 1
+        return conn, tables
+
+
+def _release_connection(db_path: Path) -> None:
+    """Release a connection obtained from _get_connection."""
+    key = str(db_path)
+    with _connection_lock:
+        users = _connection_users.get(key, 0)
+        if users > 1:
+            _connection_users[key] = users - 1
+        else:
+            _connection_users.pop(key, None)
+        _connection_released.notify_all()
+
+
 def _clear_connection_cache() -> None:
-    """Clear cached connections (call after index rebuild)."""
+    """Close and forget cached connections."""
     with _connection_lock:
-        _get_cached_connection.cache_clear()
+        for _mtime_ns, conn, _tables in _connections.values():
+            conn.close()
+        _connections.clear()
+        _connection_users.clear()
+        _connection_released.notify_all()
 
 
 def _validate_and_connect(
@@ -199,7 +304,8 @@ def _validate_and_connect(
         config: Pack configuration.
 
     Returns:
-        Tuple of (connection, embeddings_table_name).
+        Tuple of (connection, embeddings_table_name). Release the connection
+        with _release_connection(db_path) when done.
 
     Raises:
         ValueError: If validation fails with user-friendly message.
@@ -210,17 +316,17 @@ def _validate_and_connect(
             f"Expected database at: {db_path}"
         )
 
-    with _connection_lock:
-        conn = _get_cached_connection(str(db_path))
+    conn, tables = _get_connection(db_path)
 
-    tables = [row[0] for row in conn.execute("SHOW TABLES").fetchall()]
     embeddings_table = f"embeddings_{config.dimensions}"
 
     if "chunks" not in tables:
+        _release_connection(db_path)
         raise ValueError(
             f"Database missing 'chunks' table. Re-index with: chunkhound index {project_root}"
         )
     if embeddings_table not in tables:
+        _release_connection(db_path)
         raise ValueError(
             f"Database missing '{embeddings_table}' table. Re-index with: chunkhound index {project_root}"
         )
@@ -228,6 +334,50 @@ def _validate_and_connect(
     return conn, embeddings_table
 
 
+def _build_filter_sql(
+    language: str | None = None,
+    chunk_type: str | None = None,
+    exclude: str | None = None,
+) -> tuple[str, list[Any]]:
+    """Build the optional WHERE filters shared by search queries.
+
+    Args:
+        language: Optional language filter.
+        chunk_type: Optional chunk type filter.
+        exclude: Optional pipe-separated exclude patterns.
+
+    Returns:
+        Tuple of (sql_fragment, params) to append after the base WHERE clause.
+    """
+    sql = ""
+    params: list[Any] = []
+
+    if language:
+        sql += " AND LOWER(f.language) = LOWER(?)"
+        params.append(language)
+
+    if chunk_type:
+        sql += " AND LOWER(c.chunk_type) = LOWER(?)"
+        params.append(chunk_type)
+
+    if exclude:
+        for pattern in (p.strip() for p in exclude.split("|") if p.strip()):
+            sql += " AND f.path NOT LIKE ?"
+            params.append(f"%{pattern}%")
+
+    return sql, params
+
+
+def _content_sql(content_limit: int | None) -> str:
+    """Build the chunk content column, truncated in DuckDB when limited.
+
+    Note: content_limit is inlined as a validated int, like dimensions.
+    """
+    if content_limit is None:
+        return "c.code"
+    return f"substr(c.code, 1, {int(content_limit)})"
+
+
 def _build_search_sql(
     embeddings_table: str,
     dimensions: int,
@@ -236,6 +386,7 @@ def _build_search_sql(
     language: str | None = None,
     chunk_type: str | None = None,
     exclude: str | None = None,
+    content_limit: int | None = None,
 ) -> tuple[str, list[Any]]:
     """Build semantic search SQL query.
 
@@ -247,16 +398,18 @@ def _build_search_sql(
         language: Optional language filter.
         chunk_type: Optional chunk type filter.
         exclude: Optional pipe-separated exclude patterns.
+        content_limit: Optional maximum characters of chunk code to return.
 
     Returns:
         Tuple of (sql_template, params). Caller must prepend embedding param
         and append limit param.
     """
+    content = _content_sql(content_limit)
     sql = f"""
         SELECT
             c.id as chunk_id,
             c.symbol,
-            c.code as content,
+            {content} as content,
             c.chunk_type,
             c.start_line,
             c.end_line,
@@ -268,131 +421,302 @@ def _build_search_sql(
         JOIN files f ON c.file_id = f.id
         WHERE e.provider = ? AND e.model = ?
     """
-    params: list[Any] = [provider, model]
+    filter_sql, filter_params = _build_filter_sql(language, chunk_type, exclude)
+    return sql + filter_sql, [provider, model, *filter_params]
 
-    if language:
-        sql += " AND LOWER(f.language) = LOWER(?)"
-        params.append(language)
 
-    if chunk_type:
-        sql += " AND LOWER(c.chunk_type) = LOWER(?)"
-        params.append(chunk_type)
+def _build_batch_search_sql(
+    embeddings_table: str,
+    dimensions: int,
+    provider: str,
+    model: str,
+    query_count: int,
+    language: str | None = None,
+    chunk_type: str | None = None,
+    exclude: str | None = None,
+    content_limit: int | None = None,
+) -> tuple[str, list[Any]]:
+    """Build a semantic search SQL query scoring several embeddings at once.
+
+    Query embeddings are stacked into a VALUES CTE and cross joined with the
+    embeddings table, so the table is scanned once for the whole batch
+    instead of once per query. Filters are applied as a semi-join on chunk
+    ids, and the top `limit` hits per query are picked with a grouped
+    max_by aggregate (a top-N, not a full sort of every score) before
+    joining back to chunks and files. Only those at most
+    query_count * limit hits are deduplicated by file and line range,
+    keeping the highest score. Rows come back sorted by score and carry the
+    index of their best matching query as a tenth column.
 
-    if exclude:
-        for pattern in (p.strip() for p in exclude.split("|") if p.strip()):
-            sql += " AND f.path NOT LIKE ?"
-            params.append(f"%{pattern}%")
+    Args:
+        embeddings_table: Name of the embeddings table.
+        dimensions: Embedding dimensions.
+        provider: Embedding provider.
+        model: Embedding model.
+        query_count: Number of query embeddings in the batch.
+        language: Optional language filter.
+        chunk_type: Optional chunk type filter.
+        exclude: Optional pipe-separated exclude patterns.
+        content_limit: Optional maximum characters of chunk code to return.
 
-    return sql, params
+    Returns:
+        Tuple of (sql, params). Caller must prepend one embedding param per
+        query (in query index order) and append limit param.
+    """
+    vectors = ", ".join(f"({i}, ?::FLOAT[{dimensions}])" for i in range(query_count))
+    filter_sql, filter_params = _build_filter_sql(language, chunk_type, exclude)
+    content = _content_sql(content_limit)
+    sql = f"""
+        WITH q(qi, v) AS (VALUES {vectors}),
+        scored AS (
+            SELECT
+                q.qi,
+                e.chunk_id,
+                array_cosine_similarity(e.embedding, q.v) as similarity
+            FROM q
+            CROSS JOIN {embeddings_table} e
+            WHERE e.provider = ? AND e.model = ?
+                AND e.chunk_id IN (
+                    SELECT c.id
+                    FROM chunks c
+                    JOIN files f ON c.file_id = f.id
+                    WHERE TRUE{filter_sql}
+                )
+        ),
+        top_hits AS (
+            SELECT
+                qi,
+                unnest(
+                    max_by({{'chunk_id': chunk_id, 'similarity': similarity}}, similarity, ?),
+                    recursive := true
+                )
+            FROM scored
+            GROUP BY qi
+        )
+        SELECT
+            c.id as chunk_id,
+            c.symbol,
+            {content} as content,
+            c.chunk_type,
+            c.start_line,
+            c.end_line,
+            f.path as file_path,
+            f.language,
+            t.similarity,
+            t.qi
+        FROM top_hits t
+        JOIN chunks c ON t.chunk_id = c.id
+        JOIN files f ON c.file_id = f.id
+        QUALIFY row_number() OVER (
+            PARTITION BY f.path, c.start_line, c.end_line ORDER BY t.similarity DESC, t.qi
+        ) = 1
+        ORDER BY t.similarity DESC, t.qi
+    """
+    return sql, [provider, model, *filter_params]
 
 
-def _row_to_result(row: tuple, matched_query: str | None = None) -> dict[str, Any]:
-    """Convert a database row to a result dictionary.
+def _get_cached_embedding(key: tuple[str, str, str]) -> list[float] | None:
+    """Look up a cached query embedding, marking it most recently used."""
+    with _embedding_cache_lock:
+        embedding = _embedding_cache.get(key)
+        if embedding is not None:
+            _embedding_cache.move_to_end(key)
+        return embedding
 
-    Args:
-        row: Tuple from database query.
-        matched_query: Optional query that matched this result (for batch).
 
-    Returns:
-        Result dictionary with standardized keys.
-    """
-    result = {
-        "chunk_id": row[0],
-        "symbol": row[1],
-        "content": row[2],
-        "chunk_type": row[3],
-        "start_line": row[4],
-        "end_line": row[5],
-        "file_path": row[6],
-        "language": row[7],
-        "similarity": row[8],
-    }
-    if matched_query is not None:
-        result["matched_query"] = matched_query
-    return result
+def _cache_embedding(key: tuple[str, str, str], embedding: list[float]) -> None:
+    """Store a query embedding, evicting the least recently used if full."""
+    with _embedding_cache_lock:
+        _embedding_cache[key] = embedding
+        _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > _EMBEDDING_CACHE_MAXSIZE:
+            _embedding_cache.popitem(last=False)
+
+
+def _clear_embedding_cache() -> None:
+    """Clear cached query embeddings."""
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
 
 
 def _generate_embedding(query: str) -> list[float]:
-    """Generate embedding vector for a search query."""
+    """Generate embedding vector for a search query (cached per model)."""
     config = _get_config()
+    key = (config.base_url, config.model, query)
+    cached = _get_cached_embedding(key)
+    if cached is not None:
+        return cached
+
     with LogSpan(span="code.embedding", model=config.model, queryLen=len(query)) as span:
         client = _get_openai_client()
         response = client.embeddings.create(
             model=config.model,
             input=query,
         )
-        span.add(dimensions=len(response.data[0].embedding))
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
+        span.add(dimensions=len(embedding))
+        _cache_embedding(key, embedding)
+        return embedding
 
 
 def _generate_embeddings_batch(queries: list[str]) -> list[list[float]]:
-    """Generate embedding vectors for multiple queries in a single API call."""
+    """Generate embedding vectors for multiple queries in a single API call.
+
+    Cached queries are served from the embedding cache; only the misses are
+    sent to the API, split into requests of at most _EMBEDDING_BATCH_SIZE
+    inputs, and results are returned in input order.
+    """
     config = _get_config()
+    keys = [(config.base_url, config.model, q) for q in queries]
+    embeddings = [_get_cached_embedding(key) for key in keys]
+    misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if not misses:
+        return embeddings  # type: ignore[return-value]
+
     with LogSpan(
-        span="code.embedding_batch", model=config.model, queryCount=len(queries)
+        span="code.embedding_batch",
+        model=config.model,
+        queryCount=len(queries),
+        cacheHits=len(queries) - len(misses),
     ) as span:
         client = _get_openai_client()
-        response = client.embeddings.create(
-            model=config.model,
-            input=queries,
-        )
-        embeddings = [item.embedding for item in response.data]
-        span.add(dimensions=len(embeddings[0]) if embeddings else 0)
-        return embeddings
-
-
-def _format_result(
-    result: dict[str, Any],
+        for start in range(0, len(misses), _EMBEDDING_BATCH_SIZE):
+            chunk = misses[start : start + _EMBEDDING_BATCH_SIZE]
+            response = client.embeddings.create(
+                model=config.model,
+                input=[queries[i] for i in chunk],
+            )
+            for i, item in zip(chunk, response.data, strict=True):
+                embeddings[i] = item.embedding
+                _cache_embedding(keys[i], item.embedding)
+        span.add(requests=(len(misses) - 1) // _EMBEDDING_BATCH_SIZE + 1)
+        span.add(dimensions=len(response.data[0].embedding) if response.data else 0)
+        return embeddings  # type: ignore[return-value]
+
+
+def _content_limit(config: Config, expand: int | None) -> int:
+    """Get the content truncation limit for a search."""
+    return config.content_limit_expanded if expand else config.content_limit
+
+
+def _read_lines(file_path: Path, file_cache: dict[Path, list[str]] | None) -> list[str]:
+    """Read a file's lines, reusing them from file_cache when given."""
+    if file_cache is None:
+        return file_path.read_text().splitlines()
+    lines = file_cache.get(file_path)
+    if lines is None:
+        lines = file_cache[file_path] = file_path.read_text().splitlines()
+    return lines
+
+
+def _read_line_range(
+    file_path: Path,
+    start: int,
+    stop: int,
+    file_cache: dict[Path, list[str]] | None,
+    read_stop: int | None = None,
+) -> list[str]:
+    """Read lines [start, stop) of a file (0-indexed).
+
+    Small files are read whole via _read_lines. Large uncached files are
+    read only up to `read_stop` (default `stop`), so expanding matches near
+    the top of a big generated file doesn't load all of it. The prefix read
+    is cached like a whole file, so callers expanding several matches in
+    one file pass the largest stop they need as `read_stop`.
+    """
+    lines = file_cache.get(file_path) if file_cache is not None else None
+    if lines is None:
+        if file_path.stat().st_size > _PARTIAL_READ_MIN_BYTES:
+            with file_path.open() as f:
+                limit = max(stop, read_stop or 0)
+                lines = [line.rstrip("\n") for line in islice(f, limit)]
+            if file_cache is not None:
+                file_cache[file_path] = lines
+        else:
+            lines = _read_lines(file_path, file_cache)
+    return lines[start:stop]
+
+
+def _format_row(
+    row: tuple[Any, ...],
+    content_limit: int,
     project_root: Path | None = None,
     expand: int | None = None,
+    file_cache: dict[Path, list[str]] | None = None,
+    read_stops: dict[str, int] | None = None,
 ) -> dict[str, Any]:
-    """Format a search result for output.
+    """Format a search result row for output.
 
     Args:
-        result: Raw search result from database
+        row: Row from a search query, in _build_search_sql column order.
+        content_limit: Maximum characters of content to return (see
+            _content_limit for the configured values).
         project_root: Project root for file reading (needed for expand)
         expand: Number of context lines to include around match
+        file_cache: Optional per-search cache of file lines, so results from
+            the same file only read it once when expanding
+        read_stops: Optional last expanded line needed per file across the
+            search (see _format_rows), so large files are read only once
 
     Returns:
-        Formatted result dict. Content is truncated to `content_limit` chars
-        (default 500) or `content_limit_expanded` chars (default 2000) when
-        expand is used. These limits are configurable via pack config.
+        Formatted result dict with content truncated to content_limit.
     """
-    config = _get_config()
-    content = result.get("content", "")
-    start_line = result.get("start_line")
-    end_line = result.get("end_line")
+    content = row[2]
+    start_line = row[4]
+    end_line = row[5]
 
     # Expand content if requested and we have valid line numbers
     if expand and project_root and start_line and end_line:
-        file_path = project_root / result.get("file_path", "")
+        file_path = project_root / row[6]
         if file_path.exists():
             try:
-                lines = file_path.read_text().splitlines()
                 # Calculate expanded range (1-indexed to 0-indexed)
                 exp_start = max(0, start_line - 1 - expand)
-                exp_end = min(len(lines), end_line + expand)
-                content = "\n".join(lines[exp_start:exp_end])
+                lines = _read_line_range(
+                    file_path,
+                    exp_start,
+                    end_line + expand,
+                    file_cache,
+                    read_stops.get(row[6]) if read_stops else None,
+                )
+                exp_end = exp_start + len(lines)
+                content = "\n".join(lines)
                 start_line = exp_start + 1
                 end_line = exp_end
             except Exception as e:
                 # Log but don't fail - expansion is optional enhancement
                 logger.debug("Failed to expand content from %s: %s", file_path, e)
 
-    # Apply content truncation from config
-    content_limit = config.content_limit_expanded if expand else config.content_limit
-
     return {
-        "file": result.get("file_path", "unknown"),
-        "name": result.get("symbol", ""),
-        "type": result.get("chunk_type", ""),
-        "language": result.get("language", ""),
+        "file": row[6],
+        "name": row[1],
+        "type": row[3],
+        "language": row[7],
         "lines": f"{start_line or '?'}-{end_line or '?'}",
-        "score": round(result.get("similarity", 0.0), 4),
+        "score": round(row[8], 4),
         "content": content[:content_limit],
     }
 
 
+def _format_rows(
+    rows: list[tuple[Any, ...]],
+    content_limit: int,
+    project_root: Path,
+    expand: int | None,
+) -> list[dict[str, Any]]:
+    """Format search result rows, reading each expanded file at most once."""
+    read_stops: dict[str, int] = {}
+    if expand:
+        for row in rows:
+            if row[5]:
+                read_stops[row[6]] = max(read_stops.get(row[6], 0), row[5] + expand)
+    file_cache: dict[Path, list[str]] = {}
+    return [
+        _format_row(row, content_limit, project_root, expand, file_cache, read_stops)
+        for row in rows
+    ]
+
+
 def search(
     *,
     query: str,
@@ -439,8 +763,9 @@ def search(
         # Exclude test files
         code.search(query="validation", exclude="test|mock")
     """
+    config = _get_config()
     if limit is None:
-        limit = get_tool_config("code", Config).limit
+        limit = config.limit
     db_path, project_root = _get_db_path(path, db)
 
     with LogSpan(
@@ -453,13 +778,22 @@ def search(
         expand=expand,
         exclude=exclude,
     ) as s:
+        conn = None
         try:
-            # Validate database and get connection
-            config = _get_config()
+            # Request the query embedding while the database is validated.
+            # Without a database there is nothing to search, so skip the
+            # API call and let validation report the project as not indexed.
+            embedding_future = (
+                _get_embedding_executor().submit(_generate_embedding, query)
+                if db_path.exists()
+                else None
+            )
             conn, embeddings_table = _validate_and_connect(db_path, project_root, config)
-
-            # Generate query embedding
-            embedding = _generate_embedding(query)
+            embedding = (
+                embedding_future.result()
+                if embedding_future
+                else _generate_embedding(query)
+            )
 
             # Build semantic search query
             sql, params = _build_search_sql(
@@ -470,6 +804,7 @@ def search(
                 language=language,
                 chunk_type=chunk_type,
                 exclude=exclude,
+                content_limit=_content_limit(config, expand),
             )
 
             # Prepend embedding and append limit
@@ -484,10 +819,9 @@ def search(
                 return f"No results found for: {query}"
 
             # Format results
-            formatted = [
-                _format_result(_row_to_result(row), project_root, expand)
-                for row in results
-            ]
+            formatted = _format_rows(
+                results, _content_limit(config, expand), project_root, expand
+            )
 
             # Build output
             output_lines = [f"Found {len(formatted)} results for: {query}\n"]
@@ -511,6 +845,9 @@ def search(
         except Exception as e:
             s.add("error", str(e))
             return f"Error searching code: {e}"
+        finally:
+            if conn is not None:
+                _release_connection(db_path)
 
 
 def search_batch(
@@ -549,8 +886,9 @@ def search_batch(
         # Exclude test files
         code.search_batch(queries="error handling|validation", exclude="test|mock")
     """
+    config = _get_config()
     if limit is None:
-        limit = get_tool_config("code", Config).limit
+        limit = config.limit
     db_path, project_root = _get_db_path(path, db)
 
     # Parse pipe-separated queries
@@ -565,52 +903,45 @@ def search_batch(
         limit=limit,
         exclude=exclude,
     ) as s:
+        conn = None
         try:
-            # Validate database and get connection
-            config = _get_config()
+            # Request all embeddings in a single API call while the database
+            # is validated, skipped when there is no database (as in search)
+            embeddings_future = (
+                _get_embedding_executor().submit(_generate_embeddings_batch, query_list)
+                if db_path.exists()
+                else None
+            )
             conn, embeddings_table = _validate_and_connect(db_path, project_root, config)
+            embeddings = (
+                embeddings_future.result()
+                if embeddings_future
+                else _generate_embeddings_batch(query_list)
+            )
 
-            # Generate all embeddings in a single API call
-            embeddings = _generate_embeddings_batch(query_list)
-
-            # Build base SQL query (reused for all queries)
-            base_sql, base_params = _build_search_sql(
+            # Score all queries in a single scan of the embeddings table
+            sql, params = _build_batch_search_sql(
                 embeddings_table=embeddings_table,
                 dimensions=config.dimensions,
                 provider=config.provider,
                 model=config.model,
+                query_count=len(query_list),
                 language=language,
                 chunk_type=chunk_type,
                 exclude=exclude,
+                content_limit=_content_limit(config, expand),
             )
-            base_sql += " ORDER BY similarity DESC LIMIT ?"
-
-            # Collect all results
-            all_results: dict[str, dict[str, Any]] = {}  # key: file:lines
-
-            for query, embedding in zip(query_list, embeddings, strict=True):
-                # Prepend embedding and append limit
-                params = [embedding, *base_params, limit]
-                results = conn.execute(base_sql, params).fetchall()
-
-                for row in results:
-                    result = _row_to_result(row, matched_query=query)
-                    # Dedupe key: file path + line range
-                    key = f"{row[6]}:{row[4]}-{row[5]}"
-                    if key not in all_results or row[8] > all_results[key]["similarity"]:
-                        all_results[key] = result
+            params = [*embeddings, *params, limit]
+            results = conn.execute(sql, params).fetchall()
 
-            if not all_results:
+            if not results:
                 s.add("resultCount", 0)
                 return f"No results found for queries: {', '.join(query_list)}"
 
-            # Sort by similarity and format
-            sorted_results = sorted(
-                all_results.values(), key=lambda x: x["similarity"], reverse=True
+            # Rows arrive deduplicated and sorted by similarity
+            formatted = _format_rows(
+                results, _content_limit(config, expand), project_root, expand
             )
-            formatted = [
-                _format_result(r, project_root, expand) for r in sorted_results
-            ]
 
             # Build output
             output_lines = [
@@ -636,6 +967,9 @@ def search_batch(
         except Exception as e:
             s.add("error", str(e))
             return f"Error in batch search: {e}"
+        finally:
+            if conn is not None:
+                _release_connection(db_path)
 
 
 def status(*, path: str | None = None, db: str | None = None) -> str:
@@ -669,10 +1003,9 @@ def status(*, path: str | None = None, db: str | None = None) -> str:
                 f"  {db_path}"
             )
 
+        conn = None
         try:
-            with _connection_lock:
-                conn = _get_cached_connection(str(db_path))
-            tables = [row[0] for row in conn.execute("SHOW TABLES").fetchall()]
+            conn, tables = _get_connection(db_path)
 
             stats: dict[str, object] = {"tables": tables, "indexed": True}
 
@@ -734,3 +1067,6 @@ def status(*, path: str | None = None, db: str | None = None) -> str:
         except Exception as e:
             s.add("error", str(e))
             return f"Error reading index: {e}"
+        finally:
+            if conn is not None:
+                _release_connection(db_path)
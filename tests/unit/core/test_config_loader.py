@@ -254,6 +254,63 @@ def test_get_config_reload() -> None:
     assert config1 is not config2
 
 
+@pytest.mark.unit
+@pytest.mark.core
+def test_get_tool_config_cached_per_config_instance(write_config) -> None:
+    """get_tool_config reuses resolved pack config until the config changes."""
+    import ot.config.loader
+    from ot.config.loader import load_config
+    from ot.config.tool_config import get_tool_config
+
+    first = load_config(
+        write_config({"version": 1, "tools": {"brave": {"timeout": 5.0}}})
+    )
+    ot.config.loader._config = first
+    assert get_tool_config("brave") == {"timeout": 5.0}
+
+    # Mutating a returned dict must not leak into the cache
+    get_tool_config("brave")["timeout"] = 99.0
+    assert get_tool_config("brave") == {"timeout": 5.0}
+
+    # A new config instance invalidates cached entries
+    second = load_config(
+        write_config({"version": 1, "tools": {"brave": {"timeout": 7.0}}})
+    )
+    ot.config.loader._config = second
+    assert get_tool_config("brave") == {"timeout": 7.0}
+
+    ot.config.loader._config = None
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_get_tool_config_schema_instance_cached(write_config) -> None:
+    """get_tool_config validates a schema once per loaded configuration."""
+    from pydantic import BaseModel
+
+    import ot.config.loader
+    from ot.config.loader import load_config
+    from ot.config.tool_config import get_tool_config
+
+    class Config(BaseModel):
+        timeout: float = 60.0
+
+    ot.config.loader._config = load_config(
+        write_config({"version": 1, "tools": {"brave": {"timeout": 5.0}}})
+    )
+    first = get_tool_config("brave", Config)
+    assert first.timeout == 5.0
+    assert get_tool_config("brave", Config) is first
+
+    # A new config instance forces revalidation
+    ot.config.loader._config = load_config(
+        write_config({"version": 1, "tools": {"brave": {"timeout": 7.0}}})
+    )
+    assert get_tool_config("brave", Config).timeout == 7.0
+
+    ot.config.loader._config = None
+
+
 @pytest.mark.unit
 @pytest.mark.core
 def test_config_dir_tracking() -> None:
@@ -201,3 +201,19 @@ def test_http_get_with_log_span() -> None:
             mock_span_class.assert_called_once_with(span="test.fetch", key="value")
             mock_span.__enter__.assert_called_once()
             mock_span.__exit__.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+def test_warmup_creates_shared_client() -> None:
+    """warmup builds the shared client so later calls reuse it."""
+    import ot.http_client as http_client
+
+    http_client._shutdown_client()
+    try:
+        http_client.warmup()
+        client = http_client._client
+        assert isinstance(client, httpx.Client)
+        assert http_client._get_shared_client() is client
+    finally:
+        http_client._shutdown_client()
@@ -200,3 +200,35 @@ class TestMcpParamCacheBounds:
         import ot.executor.param_resolver as resolver
 
         assert isinstance(resolver._mcp_param_cache, OrderedDict)
+
+    def test_mcp_param_lookup_fills_whole_server(self):
+        """One list_tools() call caches params for every tool on the server."""
+        from unittest.mock import MagicMock, patch
+
+        import ot.executor.param_resolver as resolver
+
+        def _tool(name: str, *params: str) -> MagicMock:
+            tool = MagicMock()
+            tool.name = name
+            tool.input_schema = {"properties": {p: {} for p in params}}
+            return tool
+
+        proxy = MagicMock()
+        proxy.list_tools.return_value = [
+            _tool("search", "query", "count"),
+            _tool("fetch", "url"),
+        ]
+        resolver._mcp_param_cache.clear()
+        try:
+            with patch("ot.proxy.get_proxy_manager", return_value=proxy):
+                assert resolver.get_mcp_tool_param_names("srv", "search") == (
+                    "query",
+                    "count",
+                )
+                assert resolver.get_mcp_tool_param_names("srv", "fetch") == ("url",)
+                assert resolver.get_mcp_tool_param_names("srv", "missing") == ()
+                assert resolver.get_mcp_tool_param_names("srv", "missing") == ()
+
+            assert proxy.list_tools.call_count == 2
+        finally:
+            resolver._mcp_param_cache.clear()
@@ -89,3 +89,98 @@ class TestCreateBackup:
         backup = create_backup(original)
 
         assert backup.name == "test.yaml.bak.2"
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestGetEffectiveCwd:
+    """Tests for get_effective_cwd()."""
+
+    def test_uses_ot_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """OT_CWD is resolved and takes priority over the process cwd."""
+        from ot.paths import get_effective_cwd
+
+        monkeypatch.setenv("OT_CWD", str(tmp_path / "sub" / ".."))
+        assert get_effective_cwd() == tmp_path.resolve()
+
+    def test_follows_ot_cwd_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A changed OT_CWD value is not masked by the resolve cache."""
+        from ot.paths import get_effective_cwd
+
+        first = tmp_path / "a"
+        second = tmp_path / "b"
+        monkeypatch.setenv("OT_CWD", str(first))
+        assert get_effective_cwd() == first.resolve()
+        monkeypatch.setenv("OT_CWD", str(second))
+        assert get_effective_cwd() == second.resolve()
+
+    def test_falls_back_to_process_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without OT_CWD the process working directory is used."""
+        from ot.paths import get_effective_cwd
+
+        monkeypatch.delenv("OT_CWD", raising=False)
+        monkeypatch.chdir(tmp_path)
+        assert get_effective_cwd() == Path.cwd()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestResolveCwdPath:
+    """Tests for resolve_cwd_path()."""
+
+    def test_relative_uses_effective_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Relative paths resolve against OT_CWD."""
+        from ot.paths import resolve_cwd_path
+
+        monkeypatch.setenv("OT_CWD", str(tmp_path))
+        assert (
+            resolve_cwd_path("data/file.txt")
+            == tmp_path.resolve() / "data" / "file.txt"
+        )
+
+    def test_tilde_expands_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """~ paths expand to the home directory."""
+        from ot.paths import resolve_cwd_path
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert resolve_cwd_path("~/out.txt") == tmp_path.resolve() / "out.txt"
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestGetProjectDir:
+    """Tests for get_project_dir()."""
+
+    def test_miss_then_ensure(self, tmp_path: Path) -> None:
+        """A directory created by ensure_project_dir() is found after a miss."""
+        from ot.paths import ensure_project_dir, get_project_dir
+
+        assert get_project_dir(tmp_path) is None
+        created = ensure_project_dir(tmp_path, quiet=True)
+        assert get_project_dir(tmp_path) == created
+
+    def test_existing_dir_found(self, tmp_path: Path) -> None:
+        """An existing .onetool/ directory is returned."""
+        from ot.paths import get_project_dir
+
+        (tmp_path / ".onetool").mkdir()
+        assert get_project_dir(tmp_path) == tmp_path / ".onetool"
+
+    def test_miss_then_created_externally(self, tmp_path: Path) -> None:
+        """A directory created outside ensure_project_dir() is found after a miss."""
+        from ot.paths import ensure_project_dir, get_project_dir
+
+        assert get_project_dir(tmp_path) is None
+        (tmp_path / ".onetool").mkdir()
+
+        # ensure_project_dir() returns early for an existing directory
+        assert ensure_project_dir(tmp_path, quiet=True) == tmp_path / ".onetool"
+        assert get_project_dir(tmp_path) == tmp_path / ".onetool"
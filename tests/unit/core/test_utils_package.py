@@ -0,0 +1,43 @@
+"""Unit tests for ot.utils package exports."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def fresh_utils(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Forget ot.utils and its submodules so the test controls import order."""
+    for name in list(sys.modules):
+        if name == "ot.utils" or name.startswith("ot.utils."):
+            monkeypatch.delitem(sys.modules, name)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.usefixtures("fresh_utils")
+def test_exports_survive_submodule_import_first() -> None:
+    """Exports named like their submodules stay functions, not modules."""
+    importlib.import_module("ot.utils.truncate")
+    importlib.import_module("ot.utils.cache")
+
+    from ot.utils import cache, truncate
+
+    assert truncate("abcdef", max_length=4, indicator="") == "abcd"
+    assert callable(cache)
+    assert not isinstance(cache, type(sys))
+
+
+@pytest.mark.unit
+@pytest.mark.core
+@pytest.mark.usefixtures("fresh_utils")
+def test_lazy_exports_resolve_on_access() -> None:
+    """Other exports are resolved through the package __getattr__."""
+    utils = importlib.import_module("ot.utils")
+
+    assert "ot.utils.batch" not in sys.modules
+    assert callable(utils.normalize_items)
+    assert "ot.utils.batch" in sys.modules
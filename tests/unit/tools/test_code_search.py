@@ -14,18 +14,49 @@ import pytest
 pytest.importorskip("duckdb")
 
 from ot_tools.code_search import (
+    _build_batch_search_sql,
     _build_search_sql,
     _clear_connection_cache,
-    _format_result,
+    _clear_embedding_cache,
+    _format_row,
+    _format_rows,
     _generate_embeddings_batch,
     _get_db_path,
-    _row_to_result,
+    _release_connection,
     _validate_and_connect,
     search,
     search_batch,
     status,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start each test with empty connection and query embedding caches."""
+    _clear_connection_cache()
+    _clear_embedding_cache()
+    yield
+    _clear_connection_cache()
+    _clear_embedding_cache()
+
+
+def _make_index():
+    """Create an empty in-memory ChunkHound-style index with 2-d embeddings."""
+    import duckdb
+
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE files (id INTEGER, path VARCHAR, language VARCHAR)")
+    conn.execute(
+        "CREATE TABLE chunks (id INTEGER, file_id INTEGER, symbol VARCHAR, code VARCHAR,"
+        " chunk_type VARCHAR, start_line INTEGER, end_line INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE embeddings_2 (chunk_id INTEGER, provider VARCHAR, model VARCHAR,"
+        " embedding FLOAT[2])"
+    )
+    return conn
+
+
 # -----------------------------------------------------------------------------
 # Pure Function Tests
 # -----------------------------------------------------------------------------
@@ -113,32 +144,36 @@ class TestBuildSearchSql:
         assert "%test%" in params
         assert "%mock%" in params
 
+    def test_truncates_content_in_sql(self):
+        sql, _params = _build_search_sql(
+            embeddings_table="embeddings_1536",
+            dimensions=1536,
+            provider="openai",
+            model="text-embedding-3-small",
+            content_limit=500,
+        )
 
-@pytest.mark.unit
-@pytest.mark.tools
-class TestRowToResult:
-    """Test _row_to_result helper function."""
-
-    def test_converts_row_to_dict(self):
-        row = (1, "func_name", "code content", "function", 10, 20, "path/file.py", "python", 0.95)
-        result = _row_to_result(row)
-
-        assert result["chunk_id"] == 1
-        assert result["symbol"] == "func_name"
-        assert result["content"] == "code content"
-        assert result["chunk_type"] == "function"
-        assert result["start_line"] == 10
-        assert result["end_line"] == 20
-        assert result["file_path"] == "path/file.py"
-        assert result["language"] == "python"
-        assert result["similarity"] == 0.95
-        assert "matched_query" not in result
+        assert "substr(c.code, 1, 500) as content" in sql
 
-    def test_includes_matched_query(self):
-        row = (1, "func", "code", "function", 10, 20, "file.py", "python", 0.9)
-        result = _row_to_result(row, matched_query="test query")
+    def test_builds_batch_sql(self):
+        sql, params = _build_batch_search_sql(
+            embeddings_table="embeddings_1536",
+            dimensions=1536,
+            provider="openai",
+            model="text-embedding-3-small",
+            query_count=3,
+            exclude="test",
+        )
 
-        assert result["matched_query"] == "test query"
+        assert sql.count("?::FLOAT[1536]") == 3
+        # Top-N per query via max_by rather than ranking every scored row
+        assert "max_by(" in sql
+        assert "GROUP BY qi" in sql
+        assert "PARTITION BY q.qi" not in sql
+        # Dedup is the only window, applied to the joined top hits
+        assert sql.count("QUALIFY") == 1
+        assert "PARTITION BY f.path, c.start_line, c.end_line" in sql
+        assert params == ["openai", "text-embedding-3-small", "%test%"]
 
 
 @pytest.mark.unit
@@ -146,7 +181,7 @@ class TestRowToResult:
 class TestValidateAndConnect:
     """Test _validate_and_connect helper function."""
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     def test_raises_when_db_not_exists(self, mock_cached_conn):
         from ot_tools.code_search import Config
 
@@ -156,7 +191,7 @@ class TestValidateAndConnect:
         with pytest.raises(ValueError, match="not indexed"):
             _validate_and_connect(mock_path, Path("/project"), Config())
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     def test_raises_when_chunks_table_missing(self, mock_cached_conn):
         from ot_tools.code_search import Config
 
@@ -170,7 +205,7 @@ class TestValidateAndConnect:
         with pytest.raises(ValueError, match="chunks"):
             _validate_and_connect(mock_path, Path("/project"), Config())
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     def test_raises_when_embeddings_table_missing(self, mock_cached_conn):
         from ot_tools.code_search import Config
 
@@ -184,7 +219,7 @@ class TestValidateAndConnect:
         with pytest.raises(ValueError, match="embeddings"):
             _validate_and_connect(mock_path, Path("/project"), Config())
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     def test_returns_connection_and_table_name(self, mock_cached_conn):
         from ot_tools.code_search import Config
 
@@ -202,6 +237,32 @@ class TestValidateAndConnect:
         assert conn == mock_conn
         assert table == "embeddings_1536"
 
+    @patch("ot_tools.code_search._open_connection")
+    def test_table_names_cached_until_db_changes(self, mock_cached_conn):
+        from ot_tools.code_search import Config
+
+        mock_path = MagicMock()
+        mock_path.exists.return_value = True
+        mock_path.stat.return_value.st_mtime_ns = 1
+
+        mock_conn = MagicMock()
+        mock_cached_conn.return_value = mock_conn
+        mock_conn.execute.return_value.fetchall.return_value = [
+            ("chunks",), ("files",), ("embeddings_1536",)
+        ]
+
+        _validate_and_connect(mock_path, Path("/project"), Config())
+        _validate_and_connect(mock_path, Path("/project"), Config())
+        assert mock_conn.execute.call_count == 1
+        _release_connection(mock_path)
+        _release_connection(mock_path)
+
+        # Rebuilt database (new mtime) closes the old connection and reconnects
+        mock_path.stat.return_value.st_mtime_ns = 2
+        _validate_and_connect(mock_path, Path("/project"), Config())
+        assert mock_conn.execute.call_count == 2
+        mock_conn.close.assert_called_once()
+
 
 @pytest.mark.unit
 @pytest.mark.tools
@@ -212,13 +273,81 @@ class TestConnectionCache:
         # Just verify it doesn't raise
         _clear_connection_cache()
 
+    def test_reconnects_to_rebuilt_database(self, tmp_path):
+        import os
+
+        import duckdb
+
+        from ot_tools.code_search import _get_connection
+
+        def build(path: Path, table: str) -> None:
+            conn = duckdb.connect(str(path))
+            conn.execute(f"CREATE TABLE {table} (id INTEGER)")
+            conn.close()
+
+        db_path = tmp_path / "chunks.db"
+        build(db_path, "chunks")
+        os.utime(db_path, ns=(1_000_000_000, 1_000_000_000))
+
+        # The vss extension isn't needed to inspect tables
+        with patch(
+            "ot_tools.code_search._open_connection",
+            side_effect=lambda path: duckdb.connect(path, read_only=True),
+        ):
+            old_conn, tables = _get_connection(db_path)
+            assert tables == ("chunks",)
+            assert _get_connection(db_path)[0] is old_conn
+            _release_connection(db_path)
+            _release_connection(db_path)
+
+            # Rebuild the index file in place while the old connection is open
+            rebuilt = tmp_path / "rebuilt.db"
+            build(rebuilt, "files")
+            rebuilt.replace(db_path)
+            os.utime(db_path, ns=(2_000_000_000, 2_000_000_000))
+
+            _conn, tables = _get_connection(db_path)
+
+        assert tables == ("files",)
+        with pytest.raises(duckdb.ConnectionException):
+            old_conn.execute("SELECT 1")
+
+    @patch("ot_tools.code_search._open_connection")
+    def test_rebuild_waits_for_connection_users(self, mock_open, tmp_path):
+        import os
+        import threading
+
+        from ot_tools.code_search import _get_connection
+
+        db_path = tmp_path / "chunks.db"
+        db_path.touch()
+        os.utime(db_path, ns=(1_000_000_000, 1_000_000_000))
+        old_conn, new_conn = MagicMock(), MagicMock()
+        mock_open.side_effect = [old_conn, new_conn]
+
+        assert _get_connection(db_path)[0] is old_conn
+
+        # A search on the rebuilt index waits for the old connection's user
+        os.utime(db_path, ns=(2_000_000_000, 2_000_000_000))
+        reconnected: list[object] = []
+        thread = threading.Thread(
+            target=lambda: reconnected.append(_get_connection(db_path)[0])
+        )
+        thread.start()
+        thread.join(timeout=0.2)
+        assert thread.is_alive()
+        old_conn.close.assert_not_called()
+
+        _release_connection(db_path)
+        thread.join(timeout=5)
+
+        assert reconnected == [new_conn]
+        old_conn.close.assert_called_once()
+
     @patch("ot_tools.code_search._import_duckdb")
     def test_vss_extension_error_message(self, mock_import):
         """Test that VSS extension errors provide helpful message."""
-        from ot_tools.code_search import _get_cached_connection
-
-        # Clear cache to ensure fresh connection attempt
-        _clear_connection_cache()
+        from ot_tools.code_search import _open_connection
 
         mock_duckdb = MagicMock()
         mock_import.return_value = mock_duckdb
@@ -228,7 +357,7 @@ class TestConnectionCache:
         mock_conn.execute.side_effect = Exception("Extension 'vss' not found")
 
         with pytest.raises(RuntimeError) as exc_info:
-            _get_cached_connection("/fake/path.db")
+            _open_connection("/fake/path.db")
 
         assert "VSS extension not available" in str(exc_info.value)
         assert "pip install duckdb" in str(exc_info.value)
@@ -237,22 +366,45 @@ class TestConnectionCache:
 
 @pytest.mark.unit
 @pytest.mark.tools
-class TestFormatResult:
-    """Test _format_result formatting function."""
-
-    def test_formats_basic_result(self):
-        result = {
-            "file_path": "src/main.py",
-            "symbol": "authenticate",
-            "chunk_type": "function",
+class TestFormatRow:
+    """Test _format_row formatting function."""
+
+    def test_formats_row_tuple(self):
+        row = (1, "func_name", "code content", "function", 10, 20, "path/file.py", "python", 0.95)
+        formatted = _format_row(row, content_limit=4)
+
+        assert formatted == {
+            "file": "path/file.py",
+            "name": "func_name",
+            "type": "function",
             "language": "python",
-            "start_line": 10,
-            "end_line": 25,
-            "similarity": 0.95123,
-            "content": "def authenticate(user, password):\n    pass",
+            "lines": "10-20",
+            "score": 0.95,
+            "content": "code",
         }
 
-        formatted = _format_result(result)
+    def test_ignores_trailing_columns(self):
+        # Batch rows carry the query index as an extra column
+        row = (1, "func", "code", "function", 10, 20, "file.py", "python", 0.9, 3)
+        formatted = _format_row(row, content_limit=500)
+
+        assert formatted["name"] == "func"
+        assert formatted["score"] == 0.9
+
+    def test_formats_basic_row(self):
+        row = (
+            1,
+            "authenticate",
+            "def authenticate(user, password):\n    pass",
+            "function",
+            10,
+            25,
+            "src/main.py",
+            "python",
+            0.95123,
+        )
+
+        formatted = _format_row(row, content_limit=500)
 
         assert formatted["file"] == "src/main.py"
         assert formatted["name"] == "authenticate"
@@ -262,80 +414,41 @@ class TestFormatResult:
         assert formatted["score"] == 0.9512  # Rounded to 4 decimal places
 
     def test_truncates_long_content(self):
-        result = {
-            "file_path": "test.py",
-            "symbol": "long_function",
-            "chunk_type": "function",
-            "language": "python",
-            "start_line": 1,
-            "end_line": 100,
-            "similarity": 0.8,
-            "content": "x" * 1000,  # Long content
-        }
+        row = (1, "long_function", "x" * 1000, "function", 1, 100, "test.py", "python", 0.8)
 
-        formatted = _format_result(result)
+        formatted = _format_row(row, content_limit=500)
 
-        assert len(formatted["content"]) <= 500
+        assert len(formatted["content"]) == 500
 
-    def test_handles_missing_fields(self):
-        result = {
-            "content": "some code",
-        }
+    def test_handles_null_line_numbers(self):
+        row = (1, None, "some code", None, None, None, "test.py", None, 0.5)
 
-        formatted = _format_result(result)
+        formatted = _format_row(row, content_limit=500)
 
-        assert formatted["file"] == "unknown"
-        assert formatted["name"] == ""
-        assert formatted["type"] == ""
+        assert formatted["lines"] == "?-?"
+        assert formatted["content"] == "some code"
 
     @patch("ot_tools.code_search.get_tool_config")
-    def test_uses_configurable_content_limit(self, mock_config):
-        """Test that content truncation uses config values."""
-        from ot_tools.code_search import Config
+    def test_content_limit_from_config(self, mock_config):
+        """Test that the content limit comes from config."""
+        from ot_tools.code_search import Config, _content_limit, _get_config
 
-        # Set custom content limit (must respect validation: ge=100, le=10000)
+        # Set custom content limits (must respect validation)
         mock_config.return_value = Config(content_limit=200, content_limit_expanded=600)
+        config = _get_config()
 
-        result = {
-            "file_path": "test.py",
-            "symbol": "func",
-            "chunk_type": "function",
-            "language": "python",
-            "start_line": 1,
-            "end_line": 10,
-            "similarity": 0.9,
-            "content": "x" * 1000,
-        }
-
-        # Without expand - should use content_limit (200)
-        formatted = _format_result(result)
-        assert len(formatted["content"]) == 200
-
-    @patch("ot_tools.code_search.get_tool_config")
-    def test_uses_configurable_content_limit_expanded(self, mock_config, tmp_path):
-        """Test that expanded content uses content_limit_expanded config."""
-        from ot_tools.code_search import Config
-
-        # Must respect validation: content_limit_expanded ge=500, le=20000
-        mock_config.return_value = Config(content_limit=200, content_limit_expanded=600)
+        assert _content_limit(config, None) == 200
+        assert _content_limit(config, 5) == 600
 
+    def test_expanded_content_uses_limit(self, tmp_path):
+        """Test that expanded file content is truncated to the limit."""
         # Create a test file with lots of lines
         test_file = tmp_path / "test.py"
         test_file.write_text("\n".join(["x" * 100] * 50))  # 50 lines of 100 chars
 
-        result = {
-            "file_path": "test.py",
-            "symbol": "func",
-            "chunk_type": "function",
-            "language": "python",
-            "start_line": 20,
-            "end_line": 30,
-            "similarity": 0.9,
-            "content": "x" * 1000,
-        }
+        row = (1, "func", "x" * 1000, "function", 20, 30, "test.py", "python", 0.9)
 
-        # With expand - should use content_limit_expanded (600)
-        formatted = _format_result(result, project_root=tmp_path, expand=5)
+        formatted = _format_row(row, 600, project_root=tmp_path, expand=5)
         assert len(formatted["content"]) == 600
 
 
@@ -361,6 +474,13 @@ class TestSearch:
         assert "Error" in result
         assert "not indexed" in result
 
+    @patch("ot_tools.code_search._generate_embedding")
+    def test_skips_embedding_when_not_indexed(self, mock_embed, tmp_path):
+        result = search(query="authentication", path=str(tmp_path))
+
+        assert "not indexed" in result
+        mock_embed.assert_not_called()
+
     @patch("ot_tools.code_search._generate_embedding")
     @patch("ot_tools.code_search._validate_and_connect")
     @patch("ot_tools.code_search.get_tool_config")
@@ -477,7 +597,7 @@ class TestStatus:
         assert "not indexed" in result
         assert "chunkhound index" in result
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     @patch("ot_tools.code_search._get_db_path")
     def test_returns_statistics(self, mock_db_path, mock_cached_conn):
         mock_path = MagicMock()
@@ -503,7 +623,7 @@ class TestStatus:
         assert "indexed" in result.lower()
         assert "/project" in result
 
-    @patch("ot_tools.code_search._get_cached_connection")
+    @patch("ot_tools.code_search._open_connection")
     @patch("ot_tools.code_search._get_db_path")
     def test_handles_db_error(self, mock_db_path, mock_cached_conn):
         mock_path = MagicMock()
@@ -575,6 +695,10 @@ class TestGenerateEmbedding:
         assert result == [0.1, 0.2, 0.3]
         mock_openai.embeddings.create.assert_called_once()
 
+        # Repeated query is served from the cache
+        assert _generate_embedding("test query") == [0.1, 0.2, 0.3]
+        mock_openai.embeddings.create.assert_called_once()
+
 
 # -----------------------------------------------------------------------------
 # Batch Embedding Tests
@@ -605,16 +729,58 @@ class TestGenerateEmbeddingsBatch:
         call_args = mock_openai.embeddings.create.call_args
         assert call_args[1]["input"] == ["query1", "query2"]
 
+    @patch("ot_tools.code_search._get_openai_client")
+    def test_only_uncached_queries_sent(self, mock_client):
+        from ot_tools.code_search import _generate_embedding
+
+        mock_openai = MagicMock()
+        mock_client.return_value = mock_openai
+
+        single = MagicMock()
+        single.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
+        batch = MagicMock()
+        batch.data = [MagicMock(embedding=[0.4, 0.5, 0.6])]
+        mock_openai.embeddings.create.side_effect = [single, batch]
+
+        _generate_embedding("query1")
+        result = _generate_embeddings_batch(["query1", "query2"])
+
+        assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        call_args = mock_openai.embeddings.create.call_args
+        assert call_args[1]["input"] == ["query2"]
+
+        # Fully cached batch makes no API call
+        assert _generate_embeddings_batch(["query2", "query1"]) == [
+            [0.4, 0.5, 0.6],
+            [0.1, 0.2, 0.3],
+        ]
+        assert mock_openai.embeddings.create.call_count == 2
+
+    @patch("ot_tools.code_search._EMBEDDING_BATCH_SIZE", 2)
+    @patch("ot_tools.code_search._get_openai_client")
+    def test_splits_large_batches(self, mock_client):
+        mock_openai = MagicMock()
+        mock_client.return_value = mock_openai
+        mock_openai.embeddings.create.side_effect = lambda **kwargs: MagicMock(
+            data=[MagicMock(embedding=[float(q[1:])]) for q in kwargs["input"]]
+        )
+
+        result = _generate_embeddings_batch(["q1", "q2", "q3", "q4", "q5"])
+
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        inputs = [c[1]["input"] for c in mock_openai.embeddings.create.call_args_list]
+        assert inputs == [["q1", "q2"], ["q3", "q4"], ["q5"]]
+
 
 # -----------------------------------------------------------------------------
-# Format Result with Expand Tests
+# Format Row with Expand Tests
 # -----------------------------------------------------------------------------
 
 
 @pytest.mark.unit
 @pytest.mark.tools
-class TestFormatResultExpand:
-    """Test _format_result with expand parameter."""
+class TestFormatRowExpand:
+    """Test _format_row with expand parameter."""
 
     def test_expand_returns_more_content(self, tmp_path):
         # Create a test file
@@ -623,26 +789,60 @@ class TestFormatResultExpand:
             "line1\nline2\nline3\ndef foo():\n    pass\nline6\nline7\nline8"
         )
 
-        result = {
-            "file_path": "test.py",
-            "symbol": "foo",
-            "chunk_type": "function",
-            "language": "python",
-            "start_line": 4,
-            "end_line": 5,
-            "similarity": 0.9,
-            "content": "def foo():\n    pass",
-        }
+        row = (1, "foo", "def foo():\n    pass", "function", 4, 5, "test.py", "python", 0.9)
 
         # Without expand
-        formatted = _format_result(result)
+        formatted = _format_row(row, 500)
         assert formatted["lines"] == "4-5"
 
         # With expand
-        formatted_exp = _format_result(result, project_root=tmp_path, expand=2)
+        formatted_exp = _format_row(row, 2000, project_root=tmp_path, expand=2)
         assert "line2" in formatted_exp["content"]
         assert "line7" in formatted_exp["content"]
 
+    def test_expand_reuses_file_cache(self, tmp_path):
+        test_file = tmp_path / "test.py"
+        test_file.write_text("line1\nline2\nline3\nline4")
+        row = (1, "f", "line2\nline3", "function", 2, 3, "test.py", "python", 0.9)
+        file_cache: dict[Path, list[str]] = {}
+
+        first = _format_row(row, 2000, tmp_path, expand=1, file_cache=file_cache)
+        assert file_cache == {test_file: ["line1", "line2", "line3", "line4"]}
+
+        # Cached lines are used even after the file changes on disk
+        test_file.write_text("changed")
+        second = _format_row(row, 2000, tmp_path, expand=1, file_cache=file_cache)
+        assert second["content"] == first["content"] == "line1\nline2\nline3\nline4"
+
+    @patch("ot_tools.code_search._PARTIAL_READ_MIN_BYTES", 10)
+    def test_expand_reads_large_files_partially(self, tmp_path):
+        test_file = tmp_path / "big.py"
+        test_file.write_text("".join(f"line{i}\r\n" for i in range(1, 101)))
+        row = (1, "f", "line3\nline4", "function", 3, 4, "big.py", "python", 0.9)
+        file_cache: dict[Path, list[str]] = {}
+
+        formatted = _format_row(row, 2000, tmp_path, expand=1, file_cache=file_cache)
+
+        assert formatted["content"] == "line2\nline3\nline4\nline5"
+        assert formatted["lines"] == "2-5"
+        assert file_cache == {test_file: [f"line{i}" for i in range(1, 6)]}
+
+    @patch("ot_tools.code_search._PARTIAL_READ_MIN_BYTES", 10)
+    def test_expand_reads_large_file_once_for_all_hits(self, tmp_path):
+        test_file = tmp_path / "big.py"
+        test_file.write_text("".join(f"line{i}\n" for i in range(1, 101)))
+        rows = [
+            (1, "f", "", "function", 3, 4, "big.py", "python", 0.9),
+            (2, "g", "", "function", 20, 21, "big.py", "python", 0.8),
+        ]
+
+        with patch.object(Path, "open", autospec=True, side_effect=Path.open) as mock_open:
+            formatted = _format_rows(rows, 2000, tmp_path, expand=1)
+
+        mock_open.assert_called_once()
+        assert formatted[0]["content"] == "line2\nline3\nline4\nline5"
+        assert formatted[1]["content"] == "line19\nline20\nline21\nline22"
+
 
 # -----------------------------------------------------------------------------
 # Search with New Parameters Tests
@@ -717,6 +917,13 @@ class TestSearchBatch:
         assert "Error" in result
         assert "not indexed" in result
 
+    @patch("ot_tools.code_search._generate_embeddings_batch")
+    def test_skips_embeddings_when_not_indexed(self, mock_embed_batch, tmp_path):
+        result = search_batch(queries="auth|login", path=str(tmp_path))
+
+        assert "not indexed" in result
+        mock_embed_batch.assert_not_called()
+
     def test_returns_error_for_empty_queries(self):
         result = search_batch(queries="")
         assert "Error" in result
@@ -734,14 +941,10 @@ class TestSearchBatch:
         mock_conn = MagicMock()
         mock_validate.return_value = (mock_conn, "embeddings_1536")
 
-        # Mock two query results
-        mock_conn.execute.return_value.fetchall.side_effect = [
-            [  # First query results
-                (1, "auth_func", "def auth(): pass", "function", 10, 15, "auth.py", "python", 0.95)
-            ],
-            [  # Second query results
-                (2, "login_func", "def login(): pass", "function", 20, 25, "login.py", "python", 0.90)
-            ],
+        # One batched query returns rows tagged with their query index
+        mock_conn.execute.return_value.fetchall.return_value = [
+            (1, "auth_func", "def auth(): pass", "function", 10, 15, "auth.py", "python", 0.95, 0),
+            (2, "login_func", "def login(): pass", "function", 20, 25, "login.py", "python", 0.90, 1),
         ]
 
         result = search_batch(queries="auth|login")
@@ -749,27 +952,67 @@ class TestSearchBatch:
         assert "auth_func" in result
         assert "login_func" in result
         assert "2 queries" in result
+        # Both embeddings scored in a single SQL execution
+        assert mock_conn.execute.call_count == 1
+        params = mock_conn.execute.call_args[0][1]
+        assert params[:2] == [[0.1] * 1536, [0.2] * 1536]
+        assert params[-1] == 10
+
+    def test_deduplicates_results(self):
+        conn = _make_index()
+        conn.execute("INSERT INTO files VALUES (1, 'auth.py', 'python')")
+        conn.execute(
+            "INSERT INTO chunks VALUES (1, 1, 'auth', 'code', 'function', 10, 15),"
+            " (2, 1, 'login', 'code', 'function', 20, 25)"
+        )
+        conn.execute(
+            "INSERT INTO embeddings_2 VALUES (1, 'openai', 'm', [1.0, 0.0]),"
+            " (2, 'openai', 'm', [0.0, 1.0])"
+        )
 
-    @patch("ot_tools.code_search._generate_embeddings_batch")
-    @patch("ot_tools.code_search._validate_and_connect")
-    @patch("ot_tools.code_search.get_tool_config")
-    def test_deduplicates_results(self, mock_config, mock_validate, mock_embed_batch):
-        from ot_tools.code_search import Config
-
-        mock_config.return_value = Config(limit=10)
-        mock_embed_batch.return_value = [[0.1] * 1536, [0.2] * 1536]
-
-        mock_conn = MagicMock()
-        mock_validate.return_value = (mock_conn, "embeddings_1536")
+        sql, params = _build_batch_search_sql(
+            embeddings_table="embeddings_2",
+            dimensions=2,
+            provider="openai",
+            model="m",
+            query_count=2,
+        )
+        # Both queries match both chunks - each chunk should appear once,
+        # attributed to the query it matched best
+        rows = conn.execute(sql, [[1.0, 0.1], [0.1, 1.0], *params, 2]).fetchall()
+
+        assert [(row[1], row[9]) for row in rows] == [("auth", 0), ("login", 1)]
+
+    def test_keeps_top_limit_per_query_after_filters(self):
+        conn = _make_index()
+        conn.execute("INSERT INTO files VALUES (1, 'src/a.py', 'python'), (2, 'tests/b.py', 'python')")
+        conn.execute(
+            "INSERT INTO chunks VALUES (1, 2, 'test_near', 'code', 'function', 1, 2),"
+            " (2, 1, 'near', 'code', 'function', 3, 4),"
+            " (3, 1, 'mid', 'code', 'function', 5, 6),"
+            " (4, 1, 'far', 'code', 'function', 7, 8)"
+        )
+        conn.execute(
+            "INSERT INTO embeddings_2 VALUES (1, 'openai', 'm', [1.0, 0.0]),"
+            " (2, 'openai', 'm', [1.0, 0.1]), (3, 'openai', 'm', [1.0, 0.5]),"
+            " (4, 'openai', 'm', [0.0, 1.0])"
+        )
 
-        # Both queries return the same file:lines - should keep higher score
-        mock_conn.execute.return_value.fetchall.side_effect = [
-            [(1, "auth", "code", "function", 10, 15, "auth.py", "python", 0.85)],
-            [(1, "auth", "code", "function", 10, 15, "auth.py", "python", 0.95)],
+        sql, params = _build_batch_search_sql(
+            embeddings_table="embeddings_2",
+            dimensions=2,
+            provider="openai",
+            model="m",
+            query_count=2,
+            exclude="tests/",
+        )
+        # The excluded chunk must not take a top-2 slot. The second query's
+        # runner-up 'mid' scored higher for the first query, so it is kept
+        # once, attributed there
+        rows = conn.execute(sql, [[1.0, 0.0], [0.0, 1.0], *params, 2]).fetchall()
+
+        assert [(row[1], row[9]) for row in rows] == [
+            ("far", 1),
+            ("near", 0),
+            ("mid", 0),
         ]
-
-        result = search_batch(queries="auth|login")
-
-        # Should only have 1 result (deduplicated)
-        assert "Found 1 results" in result
-        assert "0.95" in result  # Higher score kept
@@ -449,6 +449,24 @@ def test_checksum_cache_thread_safe(tmp_path: Path) -> None:
     assert cache_info.hits >= 1  # Should have cache hit
 
 
+@pytest.mark.unit
+@pytest.mark.tools
+def test_whitespace_normaliser_matches_batch() -> None:
+    """Verify streamed normalisation equals normalise_whitespace on the whole text."""
+    import io
+
+    from ot_tools._convert.utils import WhitespaceNormaliser, normalise_whitespace
+
+    content = "\n\n\n# Title  \r\n\r\n\n\n\nrow | a\t\rnext\r\n\n\n"
+    for size in (1, 2, 5, len(content)):
+        out = io.StringIO()
+        normaliser = WhitespaceNormaliser(out)
+        for i in range(0, len(content), size):
+            normaliser.write(content[i : i + size])
+        normaliser.close()
+        assert out.getvalue() == normalise_whitespace(content)
+
+
 @pytest.mark.unit
 @pytest.mark.tools
 def test_executor_shutdown_registered() -> None: